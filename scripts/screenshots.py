@@ -6,6 +6,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from src.app import TranscribeApp
+from src.models import UnifiedItem
 from src.screens.main_menu import MainMenuScreen
 from src.screens.unified import UnifiedScreen
 
@@ -22,11 +23,13 @@ def _make_mock_app(tmpdir: str, db_mock: MagicMock | None = None) -> TranscribeA
     mock_config.raw_transcripts_dir = Path(tmpdir) / "transcripts"
     mock_config.auto_process = True
 
-    mock_db = db_mock or MagicMock()
-    mock_db.get_pending_count.return_value = 3
-    mock_db.get_unlabeled_count.return_value = 1
-    mock_db.list_unified.return_value = []
-    mock_db.list_audio_files.return_value = []
+    mock_db = db_mock
+    if mock_db is None:
+        mock_db = MagicMock()
+        mock_db.get_pending_count.return_value = 3
+        mock_db.get_unlabeled_count.return_value = 1
+        mock_db.list_unified.return_value = []
+        mock_db.list_audio_files.return_value = []
 
     mock_recorder = MagicMock()
     mock_recorder.is_recording = False
@@ -62,50 +65,45 @@ async def _screenshot_main_menu() -> None:
 # -- Files & Labels screenshot ------------------------------------------------
 
 MOCK_UNIFIED_ROWS = [
-    {
-        "type": "audio",
-        "audio_path": "/tmp/recordings/standup-2026-02-03.mp4",
-        "audio_filename": "standup-2026-02-03.mp4",
-        "transcript_path": "/tmp/transcripts/standup-2026-02-03.yaml",
-        "stage": "to label",
-        "speakers": "Speaker A, Speaker B",
-        "date": "2026-02-03",
-        "duration_seconds": 1823,
-        "name": "standup-2026-02-03",
-    },
-    {
-        "type": "audio",
-        "audio_path": "/tmp/recordings/interview-2026-02-05.mp4",
-        "audio_filename": "interview-2026-02-05.mp4",
-        "transcript_path": None,
-        "stage": "to transcribe",
-        "speakers": None,
-        "date": "2026-02-05",
-        "duration_seconds": 3604,
-        "name": "interview-2026-02-05",
-    },
-    {
-        "type": "audio",
-        "audio_path": "/tmp/recordings/retro-2026-02-07.mp4",
-        "audio_filename": "retro-2026-02-07.mp4",
-        "transcript_path": "/tmp/transcripts/retro-2026-02-07.yaml",
-        "stage": "summarised",
-        "speakers": "Alice, Bob, Carol",
-        "date": "2026-02-07",
-        "duration_seconds": 2710,
-        "name": "Weekly Retrospective",
-    },
-    {
-        "type": "audio",
-        "audio_path": "/tmp/recordings/planning-2026-02-09.m4a",
-        "audio_filename": "planning-2026-02-09.m4a",
-        "transcript_path": None,
-        "stage": "to transcribe",
-        "speakers": None,
-        "date": "2026-02-09",
-        "duration_seconds": None,
-        "name": "planning-2026-02-09",
-    },
+    UnifiedItem(
+        type="audio",
+        audio_path="/tmp/recordings/standup-2026-02-03.mp4",
+        audio_filename="standup-2026-02-03.mp4",
+        transcript_path="/tmp/transcripts/standup-2026-02-03.yaml",
+        stage="to label",
+        speakers="Speaker A, Speaker B",
+        date="2026-02-03",
+        duration_seconds=1823,
+        name="standup-2026-02-03",
+    ),
+    UnifiedItem(
+        type="audio",
+        audio_path="/tmp/recordings/interview-2026-02-05.mp4",
+        audio_filename="interview-2026-02-05.mp4",
+        stage="to transcribe",
+        date="2026-02-05",
+        duration_seconds=3604,
+        name="interview-2026-02-05",
+    ),
+    UnifiedItem(
+        type="audio",
+        audio_path="/tmp/recordings/retro-2026-02-07.mp4",
+        audio_filename="retro-2026-02-07.mp4",
+        transcript_path="/tmp/transcripts/retro-2026-02-07.yaml",
+        stage="summarised",
+        speakers="Alice, Bob, Carol",
+        date="2026-02-07",
+        duration_seconds=2710,
+        name="Weekly Retrospective",
+    ),
+    UnifiedItem(
+        type="audio",
+        audio_path="/tmp/recordings/planning-2026-02-09.m4a",
+        audio_filename="planning-2026-02-09.m4a",
+        stage="to transcribe",
+        date="2026-02-09",
+        name="planning-2026-02-09",
+    ),
 ]
 
 
@@ -1,5 +1,7 @@
 """Command palette provider for Transcribe TUI."""
 
+import functools
+
 from textual.command import DiscoveryHit, Hit, Hits, Provider
 
 from .screens.main_menu import MainMenuScreen
@@ -61,14 +63,26 @@ class TranscribeCommands(Provider):
                 self.app.exit()
         return callback
 
-    async def discover(self) -> Hits:
-        """Yield all commands for display before any user input."""
-        for display, action, help_text in self.COMMANDS:
-            yield DiscoveryHit(
+    @functools.cached_property
+    def _discovery_hits(self) -> tuple[DiscoveryHit, ...]:
+        """The command list is static, so build the hits once per provider.
+
+        Cached per instance rather than per class: the callbacks resolve
+        self.app, so a class-level cache would pin the first app.
+        """
+        return tuple(
+            DiscoveryHit(
                 display=display,
                 command=self._make_callback(action),
                 help=help_text,
             )
+            for display, action, help_text in self.COMMANDS
+        )
+
+    async def discover(self) -> Hits:
+        """Yield all commands for display before any user input."""
+        for hit in self._discovery_hits:
+            yield hit
 
     async def search(self, query: str) -> Hits:
         """Fuzzy-match commands against user input."""
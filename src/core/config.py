@@ -16,6 +16,7 @@ class Config:
         "done_dir": "~/recordings/.done",
         "api_key_file": "~/.transcribe.apikey.json",
         "auto_process": True,
+        "transcribe_concurrency": 3,
     }
 
     def __init__(self, config_dir: str | Path | None = None):
@@ -53,6 +54,8 @@ class Config:
                 self._config = json.load(f)
         else:
             self._config = self.DEFAULT_CONFIG.copy()
+        # The config may point at a different key file now
+        self._api_key_cache: tuple[Path, float, str | None] | None = None
 
     def init(self) -> None:
         """Initialize config file with defaults if missing."""
@@ -98,15 +101,29 @@ class Config:
     def get_api_key(self) -> str | None:
         """Get the AssemblyAI API key.
 
+        The parsed key is cached against the key file's path and mtime,
+        so repeated calls (e.g. the periodic scan tick) don't reread the
+        file, while pointing api_key_file elsewhere invalidates the cache
+        even if the two files share an mtime.
+
         Returns:
             The API key or None if not found.
         """
         key_file = Path(self.get("api_key_file"))
-        if key_file.exists():
-            with open(key_file) as f:
-                data = json.load(f)
-                return data.get("assemblyai_api_key") or data.get("api_key")
-        return None
+        try:
+            mtime = key_file.stat().st_mtime
+        except OSError:
+            self._api_key_cache = None
+            return None
+
+        if self._api_key_cache and self._api_key_cache[:2] == (key_file, mtime):
+            return self._api_key_cache[2]
+
+        with open(key_file) as f:
+            data = json.load(f)
+        key = data.get("assemblyai_api_key") or data.get("api_key")
+        self._api_key_cache = (key_file, mtime, key)
+        return key
 
     @property
     def watch_dir(self) -> Path:
@@ -132,3 +149,8 @@ class Config:
     def auto_process(self) -> bool:
         """Get the auto-process setting."""
         return bool(self.get("auto_process", True))
+
+    @property
+    def transcribe_concurrency(self) -> int:
+        """Get the number of concurrent transcription workers."""
+        return int(self.get("transcribe_concurrency", 3) or 3)
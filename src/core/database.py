@@ -3,11 +3,10 @@
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator
 
 import yaml
 
-from ..models import AudioFile, Transcript
+from ..models import AudioFile, Transcript, UnifiedItem, _YamlLoader
 
 
 class Database:
@@ -34,9 +33,12 @@ class Database:
             FOREIGN KEY (audio_file_id) REFERENCES audio_files(id)
         );
 
-        CREATE INDEX IF NOT EXISTS idx_audio_files_path ON audio_files(path);
-        CREATE INDEX IF NOT EXISTS idx_transcripts_path ON transcripts(path);
         CREATE INDEX IF NOT EXISTS idx_transcripts_labeled ON transcripts(labeled_at);
+
+        -- path columns are UNIQUE, which already gives them an implicit
+        -- index; drop the explicit duplicates from older databases.
+        DROP INDEX IF EXISTS idx_audio_files_path;
+        DROP INDEX IF EXISTS idx_transcripts_path;
     """
 
     def __init__(self, db_path: str | Path):
@@ -52,10 +54,41 @@ class Database:
         """Get or create database connection with autocommit mode."""
         if self._conn is None:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
-            self._conn = sqlite3.connect(str(self.db_path), isolation_level=None)
+            # Background workers share this connection (refresh scans,
+            # bulk transcription updates); SQLite serializes the writes
+            self._conn = sqlite3.connect(
+                str(self.db_path), isolation_level=None, check_same_thread=False
+            )
             self._conn.row_factory = sqlite3.Row
         return self._conn
 
+    def configure_for_tests(self) -> None:
+        """Trade durability for speed; only for throwaway databases.
+
+        Test databases are discarded after the run, so journal and
+        fsync guarantees are pure overhead there.
+        """
+        conn = self._get_conn()
+        conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+    def reset_tables(self) -> None:
+        """Delete all rows from every table.
+
+        Much cheaper than re-running the schema DDL; used by tests
+        that share one database across cases.
+        """
+        conn = self._get_conn()
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DELETE FROM transcripts")
+            conn.execute("DELETE FROM audio_files")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
     def init(self) -> None:
         """Initialize database schema."""
         conn = self._get_conn()
@@ -92,7 +125,7 @@ class Database:
         if not p.exists():
             return None
         content = p.read_text()
-        docs = list(yaml.safe_load_all(content))
+        docs = list(yaml.load_all(content, Loader=_YamlLoader))
         if not docs:
             return None
         frontmatter = docs[0]
@@ -145,6 +178,57 @@ class Database:
         # File already existed, get its ID
         return self.get_audio_id(path) or 0
 
+    def add_audio_if_new(self, path: str | Path) -> int | None:
+        """Add an audio file only if it is not already tracked.
+
+        Relies on the UNIQUE constraint plus ``INSERT OR IGNORE``, so
+        callers need no separate existence check.
+
+        Args:
+            path: Path to the audio file.
+
+        Returns:
+            The new row ID, or None if the path was already present.
+        """
+        path = str(path)
+        conn = self._get_conn()
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO audio_files (path, filename) VALUES (?, ?)",
+            (path, Path(path).name),
+        )
+        conn.commit()
+        return cursor.lastrowid if cursor.rowcount else None
+
+    def add_many_audio(self, paths: list[str | Path]) -> None:
+        """Add several audio files in one transaction.
+
+        Args:
+            paths: Paths to the audio files.
+        """
+        if not paths:
+            return
+        rows = [(str(p), Path(p).name) for p in paths]
+        conn = self._get_conn()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO audio_files (path, filename) VALUES (?, ?)",
+                rows,
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def known_audio_paths(self) -> frozenset[str]:
+        """All tracked audio paths, for O(1) membership checks in scans.
+
+        One SELECT replaces a per-file ``audio_exists`` round-trip.
+        """
+        conn = self._get_conn()
+        rows = conn.execute("SELECT path FROM audio_files").fetchall()
+        return frozenset(row["path"] for row in rows)
+
     def get_audio_id(self, path: str | Path) -> int | None:
         """Get audio file ID by path.
 
@@ -176,6 +260,39 @@ class Database:
         )
         conn.commit()
 
+    def bulk_mark_transcribed(
+        self, records: list[tuple[str | Path, str | Path]]
+    ) -> None:
+        """Mark several audio files transcribed and add their transcripts.
+
+        Runs all updates and inserts in a single transaction, so N files
+        cost one commit instead of 3N.
+
+        Args:
+            records: List of (audio_path, transcript_path) pairs.
+        """
+        if not records:
+            return
+        pairs = [(str(a), str(t)) for a, t in records]
+        conn = self._get_conn()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                """UPDATE audio_files
+                   SET transcribed_at = CURRENT_TIMESTAMP, transcript_path = ?
+                   WHERE path = ?""",
+                [(t, a) for a, t in pairs],
+            )
+            conn.executemany(
+                """INSERT OR IGNORE INTO transcripts (path, audio_file_id, duration_seconds)
+                   VALUES (?, (SELECT id FROM audio_files WHERE path = ?), ?)""",
+                [(t, a, self._read_duration_from_yaml(t)) for a, t in pairs],
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
     def audio_exists(self, path: str | Path) -> bool:
         """Check if an audio file exists in the database.
 
@@ -273,6 +390,29 @@ class Database:
         ).fetchone()
         return row["id"] if row else 0
 
+    def add_transcripts(self, paths: list[str | Path]) -> None:
+        """Add several transcript records in one transaction.
+
+        Args:
+            paths: Paths to the transcript files.
+        """
+        if not paths:
+            return
+        rows = [
+            (str(p), self._read_duration_from_yaml(str(p))) for p in paths
+        ]
+        conn = self._get_conn()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO transcripts (path, duration_seconds) VALUES (?, ?)",
+                rows,
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
     def mark_labeled(
         self, transcript_path: str | Path, speakers: str | None = None
     ) -> None:
@@ -459,12 +599,11 @@ class Database:
             )
         return result
 
-    def list_unified(self) -> list[dict]:
+    def list_unified(self) -> list[UnifiedItem]:
         """List all audio files and transcripts unified, sorted by most recent activity.
 
         Returns:
-            List of dicts with keys: type, audio_path, audio_filename, transcript_path,
-            stage, speakers, date, duration, name, meeting_title.
+            List of UnifiedItem records, one per audio file / transcript pair.
         """
         conn = self._get_conn()
 
@@ -481,6 +620,7 @@ class Database:
                 t.created_at,
                 t.labeled_at,
                 t.summarized_at,
+                t.summary_path,
                 t.meeting_title,
                 t.speakers,
                 t.duration_seconds
@@ -514,21 +654,36 @@ class Database:
                         pass
                     break
 
-            result.append({
-                "type": "audio" if not row["transcript_path"] else "transcript",
-                "audio_path": row["audio_path"],
-                "audio_filename": row["audio_filename"],
-                "transcript_path": row["transcript_path"],
-                "stage": stage,
-                "speakers": row["speakers"],
-                "date": date_str,
-                "duration_seconds": row["duration_seconds"],
-                "name": row["meeting_title"] or row["audio_filename"],
-                "meeting_title": row["meeting_title"],
-            })
+            result.append(UnifiedItem(
+                type="audio" if not row["transcript_path"] else "transcript",
+                audio_path=row["audio_path"],
+                audio_filename=row["audio_filename"],
+                transcript_path=row["transcript_path"],
+                summary_path=row["summary_path"],
+                stage=stage,
+                speakers=row["speakers"],
+                date=date_str,
+                duration_seconds=row["duration_seconds"],
+                name=row["meeting_title"] or row["audio_filename"],
+                meeting_title=row["meeting_title"],
+            ))
 
         return result
 
+    def change_token(self) -> tuple[int, int]:
+        """Cheap token that changes whenever the database contents change.
+
+        Combines ``PRAGMA data_version`` (bumped when another connection
+        writes) with this connection's ``total_changes`` counter, so both
+        external and local writes invalidate cached reads.
+
+        Returns:
+            An opaque comparable token.
+        """
+        conn = self._get_conn()
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return version, conn.total_changes
+
     # Statistics
 
     def get_pending_count(self) -> int:
@@ -36,6 +36,16 @@ class Recorder:
         """
         self.output_dir = Path(output_dir)
         self._process: subprocess.Popen | None = None
+        # (seconds, formatted) pair so sub-second pollers reuse the string
+        self._last_duration: tuple[int, str] = (-1, "00:00:00")
+        # Invoked after start/stop/pause/resume so UIs can react to state
+        # transitions without polling.
+        self.on_state_change: Callable[[], None] | None = None
+
+    def _notify_state_change(self) -> None:
+        """Invoke the state-change callback, if one is registered."""
+        if self.on_state_change:
+            self.on_state_change()
 
     def _detect_audio_sources(self) -> tuple[str, str | None]:
         """Detect available audio sources.
@@ -91,11 +101,18 @@ class Recorder:
         now = int(time.time())
         duration = max(0, now - start - self._get_paused_total())
 
+        # The string only changes once per second; don't re-format it for
+        # every sub-second poll
+        if duration == self._last_duration[0]:
+            return self._last_duration[1]
+
         hours = duration // 3600
         minutes = (duration % 3600) // 60
         seconds = duration % 60
 
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        formatted = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        self._last_duration = (duration, formatted)
+        return formatted
 
     def get_duration_seconds(self) -> int:
         """Get current recording duration in seconds (excludes paused time)."""
@@ -179,6 +196,7 @@ class Recorder:
         if progress_callback:
             progress_callback(f"Recording started (PID: {self._process.pid})")
 
+        self._notify_state_change()
         return output_file
 
     def stop(
@@ -228,6 +246,8 @@ class Recorder:
             if f.exists():
                 f.unlink()
 
+        self._notify_state_change()
+
         if output_file and output_file.exists():
             # Move from .recording/ temp dir to the watch dir (atomic rename)
             final_file = self.output_dir / output_file.name
@@ -252,6 +272,7 @@ class Recorder:
             os.kill(pid, signal.SIGSTOP)
             self.PAUSED_AT_FILE.write_text(str(int(time.time())))
             self.PAUSE_FILE.touch()
+            self._notify_state_change()
 
     def resume(self) -> None:
         """Resume the recording by sending SIGCONT to ffmpeg."""
@@ -272,6 +293,7 @@ class Recorder:
             self.PAUSED_AT_FILE.unlink()
 
         self.PAUSE_FILE.unlink()
+        self._notify_state_change()
 
     def toggle(
         self,
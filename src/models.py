@@ -7,6 +7,11 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml extension not installed
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class AudioFile:
@@ -51,6 +56,27 @@ class Transcript:
         return "unlabeled"
 
 
+@dataclass(slots=True)
+class UnifiedItem:
+    """A row in the unified files-and-transcripts view.
+
+    Slotted so the per-row cost is attribute loads rather than dict
+    lookups; the unified table can hold hundreds of these.
+    """
+
+    type: str
+    audio_path: str | None = None
+    audio_filename: str | None = None
+    transcript_path: str | None = None
+    summary_path: str | None = None
+    stage: str = "-"
+    speakers: str | None = None
+    date: str | None = None
+    duration_seconds: int | None = None
+    name: str | None = None
+    meeting_title: str | None = None
+
+
 @dataclass
 class Speaker:
     """Represents a speaker in a transcript."""
@@ -68,6 +94,11 @@ class Speaker:
         """Create from dictionary."""
         return cls(id=data["id"], name=data.get("name"))
 
+    @classmethod
+    def from_dicts(cls, rows: list[dict[str, Any]]) -> list["Speaker"]:
+        """Create a list of speakers in one pass."""
+        return [cls(id=row["id"], name=row.get("name")) for row in rows]
+
 
 @dataclass
 class Utterance:
@@ -97,6 +128,19 @@ class Utterance:
             text=data["text"],
         )
 
+    @classmethod
+    def from_dicts(cls, rows: list[dict[str, Any]]) -> list["Utterance"]:
+        """Create a list of utterances in one pass."""
+        return [
+            cls(
+                speaker=row["speaker"],
+                start=row["start"],
+                end=row["end"],
+                text=row["text"],
+            )
+            for row in rows
+        ]
+
 
 @dataclass
 class TranscriptData:
@@ -194,7 +238,7 @@ class TranscriptData:
     def from_yaml(cls, content: str) -> "TranscriptData":
         """Parse transcript from YAML string."""
         # Split into documents (frontmatter and utterances)
-        docs = list(yaml.safe_load_all(content))
+        docs = list(yaml.load_all(content, Loader=_YamlLoader))
 
         if len(docs) < 2:
             raise ValueError("Invalid transcript format: expected two YAML documents")
@@ -208,10 +252,10 @@ class TranscriptData:
             transcribed = datetime.fromisoformat(transcribed)
 
         # Parse speakers
-        speakers = [Speaker.from_dict(s) for s in frontmatter.get("speakers", [])]
+        speakers = Speaker.from_dicts(frontmatter.get("speakers", []))
 
         # Parse utterances
-        utterances = [Utterance.from_dict(u) for u in utterance_data.get("utterances", [])]
+        utterances = Utterance.from_dicts(utterance_data.get("utterances", []))
 
         return cls(
             source_file=frontmatter["source_file"],
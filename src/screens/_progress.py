@@ -0,0 +1,26 @@
+"""Progress-callback helpers shared by the worker-driven screens."""
+
+import time
+
+
+def throttled_progress(app, notify, *, window: float = 0.5):
+    """Build a worker-thread progress callback that throttles toasts.
+
+    Polling can report dozens of updates per file; intermediate messages
+    within ``window`` seconds of the last toast are dropped so each one
+    doesn't trigger a re-render. Errors and completion messages always
+    go through.
+    """
+    last_notify = 0.0
+
+    def progress(msg: str) -> None:
+        nonlocal last_notify
+        now = time.monotonic()
+        lowered = msg.lower()
+        if "error" not in lowered and "complet" not in lowered:
+            if now - last_notify < window:
+                return
+            last_notify = now
+        app.call_from_thread(notify, msg, severity="information")
+
+    return progress
@@ -1,6 +1,8 @@
 """Main menu screen for Transcribe TUI."""
 
 import functools
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from textual.app import ComposeResult
@@ -11,11 +13,16 @@ from textual.widgets import Button, Footer, Header, Label, Static
 from textual.worker import Worker, WorkerState
 
 from ..core.transcriber import Transcriber, TranscriptionError
+from ._progress import throttled_progress
 
 
 class MainMenuScreen(Screen):
     """Main menu screen with recording status and quick actions."""
 
+    AUDIO_EXTS = frozenset(
+        {".mp4", ".m4a", ".mp3", ".wav", ".ogg", ".webm", ".flac"}
+    )
+
     BINDINGS = [
         ("r", "toggle_recording", "Toggle Recording"),
         ("a", "toggle_auto_process", "Auto Process"),
@@ -138,16 +145,21 @@ class MainMenuScreen(Screen):
         if not watch_dir.exists():
             return
 
-        audio_extensions = {"mp4", "m4a", "mp3", "wav", "ogg", "webm", "flac"}
+        known = app.db.known_audio_paths()
         new_files = []
-
-        for file in watch_dir.iterdir():
-            if file.is_file() and file.suffix.lower().lstrip(".") in audio_extensions:
-                if not app.db.audio_exists(str(file)):
-                    app.db.add_audio(str(file))
-                    new_files.append(file)
+        # scandir reuses the directory read for the is_file check, so
+        # no per-entry stat call is needed
+        with os.scandir(watch_dir) as entries:
+            for entry in entries:
+                if (
+                    entry.is_file(follow_symlinks=False)
+                    and os.path.splitext(entry.name)[1].lower() in self.AUDIO_EXTS
+                    and entry.path not in known
+                ):
+                    new_files.append(entry.path)
 
         if new_files:
+            app.db.add_many_audio(new_files)
             self._update_status()
             self.notify(f"Found {len(new_files)} new file(s)")
 
@@ -172,26 +184,22 @@ class MainMenuScreen(Screen):
                 thread=True,
             )
 
+    _BUTTON_ACTIONS = {
+        "start-btn": "start_recording",
+        "stop-btn": "stop_recording",
+        "pause-btn": "toggle_pause",
+        "files-btn": "show_files",
+        "process-btn": "process_all",
+        "config-btn": "edit_config",
+        "auto-btn": "toggle_auto_process",
+        "quit-btn": "quit",
+    }
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        button_id = event.button.id
-
-        if button_id == "start-btn":
-            self.action_start_recording()
-        elif button_id == "stop-btn":
-            self.action_stop_recording()
-        elif button_id == "pause-btn":
-            self.action_toggle_pause()
-        elif button_id == "files-btn":
-            self.action_show_files()
-        elif button_id == "process-btn":
-            self.action_process_all()
-        elif button_id == "config-btn":
-            self.action_edit_config()
-        elif button_id == "auto-btn":
-            self.action_toggle_auto_process()
-        elif button_id == "quit-btn":
-            self.action_quit()
+        action = self._BUTTON_ACTIONS.get(event.button.id)
+        if action:
+            getattr(self, f"action_{action}")()
 
     def action_start_recording(self) -> None:
         """Start recording."""
@@ -280,43 +288,49 @@ class MainMenuScreen(Screen):
         transcriber = Transcriber(api_key)
         output_dir = app.config.raw_transcripts_dir
 
-        processed = 0
-        for audio in files:
-            try:
-                self.app.call_from_thread(
-                    self.notify, f"Transcribing: {audio.filename}", severity="information"
-                )
-
-                # Transcribe and save
-                transcript_path = transcriber.transcribe_and_save(
-                    audio.path,
-                    output_dir,
-                    progress_callback=lambda msg: self.app.call_from_thread(self.notify, msg),
-                )
-
-                # Update database
-                audio_id = app.db.get_audio_id(audio.path)
-                app.db.mark_transcribed(audio.path, str(transcript_path))
-                if audio_id:
-                    app.db.add_transcript(str(transcript_path), audio_id)
-
-                processed += 1
-                self.app.call_from_thread(
-                    self.notify, f"Completed: {audio.filename}", severity="information"
-                )
-
-            except TranscriptionError as e:
-                self.app.call_from_thread(
-                    self.notify, f"Error transcribing {audio.filename}: {e}", severity="error"
-                )
-            except Exception as e:
-                self.app.call_from_thread(
-                    self.notify, f"Unexpected error: {e}", severity="error"
-                )
+        def transcribe_one(audio) -> Path:
+            self.app.call_from_thread(
+                self.notify, f"Transcribing: {audio.filename}", severity="information"
+            )
+
+            return transcriber.transcribe_and_save(
+                audio.path,
+                output_dir,
+                progress_callback=throttled_progress(self.app, self.notify),
+            )
+
+        # Transcription is network-bound, so run a bounded pool of uploads
+        # concurrently; DB updates stay on this worker thread and are
+        # committed once at the end instead of per file.
+        completed: list[tuple[str, str]] = []
+        max_workers = min(len(files), app.config.transcribe_concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(transcribe_one, audio): audio for audio in files}
+            for future in as_completed(futures):
+                audio = futures[future]
+                try:
+                    transcript_path = future.result()
+                    completed.append((audio.path, str(transcript_path)))
+                    self.app.call_from_thread(
+                        self.notify, f"Completed: {audio.filename}", severity="information"
+                    )
+
+                except TranscriptionError as e:
+                    self.app.call_from_thread(
+                        self.notify, f"Error transcribing {audio.filename}: {e}", severity="error"
+                    )
+                except Exception as e:
+                    self.app.call_from_thread(
+                        self.notify, f"Unexpected error: {e}", severity="error"
+                    )
+
+        app.db.bulk_mark_transcribed(completed)
 
         self.app.call_from_thread(self._update_status)
         self.app.call_from_thread(
-            self.notify, f"Processed {processed}/{len(files)} file(s)", severity="information"
+            self.notify,
+            f"Processed {len(completed)}/{len(files)} file(s)",
+            severity="information",
         )
 
     def action_edit_config(self) -> None:
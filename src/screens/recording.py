@@ -1,9 +1,12 @@
 """Recording screen for Transcribe TUI."""
 
+import asyncio
+import threading
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical
-from textual.reactive import reactive
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Button, Footer, Header, Label, Static
 
 
@@ -16,116 +19,175 @@ class RecordingScreen(Screen):
         ("escape", "go_back", "Back"),
     ]
 
-    is_recording = reactive(False)
-    duration = reactive("00:00:00")
-
     def compose(self) -> ComposeResult:
+        # Bind widget references at construction time; these are composed
+        # once and never replaced, so no query_one lookups are needed later.
         yield Header()
         with Container(id="recording-container"):
-            with Vertical(id="recording-box"):
+            self._recording_box = Vertical(id="recording-box")
+            with self._recording_box:
                 yield Label("Recording Controls", classes="title")
-                yield Label("Status: Idle", id="rec-status")
-                yield Label("00:00:00", id="rec-duration")
+                self._status_label = Label("Status: Idle", id="rec-status")
+                yield self._status_label
+                self._duration_label = Label("00:00:00", id="rec-duration")
+                yield self._duration_label
                 with Horizontal(id="rec-buttons"):
-                    yield Button("Start", id="start-btn", variant="success")
-                    yield Button("Stop", id="stop-btn", variant="error", disabled=True)
-                    yield Button("Pause", id="pause-btn", disabled=True)
+                    self._start_btn = Button("Start", id="start-btn", variant="success")
+                    yield self._start_btn
+                    self._stop_btn = Button(
+                        "Stop", id="stop-btn", variant="error", disabled=True
+                    )
+                    yield self._stop_btn
+                    self._pause_btn = Button("Pause", id="pause-btn", disabled=True)
+                    yield self._pause_btn
                     yield Button("Back", id="back-btn")
         yield Footer()
 
     def on_mount(self) -> None:
         """Called when screen is mounted."""
-        self._update_display()
-        self.set_interval(1.0, self._update_display)
-
-    def _update_display(self) -> None:
-        """Update the recording display."""
-        app = self.app
-        recorder = app.recorder
-
-        status_label = self.query_one("#rec-status", Label)
-        duration_label = self.query_one("#rec-duration", Label)
-        recording_box = self.query_one("#recording-box")
-        start_btn = self.query_one("#start-btn", Button)
-        stop_btn = self.query_one("#stop-btn", Button)
-        pause_btn = self.query_one("#pause-btn", Button)
-
-        if recorder.is_recording:
-            self.is_recording = True
-            self.duration = recorder.get_duration()
-
-            if recorder.is_paused:
-                status_label.update("Status: PAUSED")
-                status_label.add_class("recording")
-                pause_btn.label = "Resume"
-            else:
-                status_label.update("Status: RECORDING")
-                status_label.add_class("recording")
-                pause_btn.label = "Pause"
-
-            duration_label.update(self.duration)
-            recording_box.add_class("recording")
-            start_btn.disabled = True
-            stop_btn.disabled = False
-            pause_btn.disabled = False
+        self._last_state: tuple[bool, bool] | None = None
+        self._last_duration_str: str | None = None
+        self._recording_class_applied = False
+        self._timer: Timer | None = None
+        # self.app walks the node tree on every access; the app, recorder,
+        # and db never change for the life of the screen, so cache them.
+        self._app = self.app
+        self._recorder = self._app.recorder
+        self._db = self._app.db
+        # Event-driven: the recorder pushes state transitions to us, and
+        # the timer only refreshes the duration field while recording.
+        self._recorder.on_state_change = self._on_recorder_state_change
+        self._update_buttons_and_status()
+
+    def on_unmount(self) -> None:
+        """Called when screen is unmounted."""
+        recorder = self._recorder
+        if recorder.on_state_change == self._on_recorder_state_change:
+            recorder.on_state_change = None
+
+    def _on_recorder_state_change(self) -> None:
+        """Recorder state-change hook; safe to fire from worker threads."""
+        if threading.current_thread() is threading.main_thread():
+            self._update_buttons_and_status()
         else:
-            self.is_recording = False
-            self.duration = "00:00:00"
-
-            status_label.update("Status: Idle")
-            status_label.remove_class("recording")
-            duration_label.update("00:00:00")
-            recording_box.remove_class("recording")
-            start_btn.disabled = False
-            stop_btn.disabled = True
-            pause_btn.disabled = True
-            pause_btn.label = "Pause"
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
+            self._app.call_from_thread(self._update_buttons_and_status)
+
+    def _start_timer(self) -> None:
+        """Start the duration refresh timer if not already running."""
+        if self._timer is None:
+            self._timer = self.set_interval(0.25, self._update_duration_only)
+
+    def _stop_timer(self) -> None:
+        """Stop the duration refresh timer."""
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer = None
+
+    def _update_duration_only(self) -> None:
+        """Refresh just the duration label (timer path)."""
+        recorder = self._recorder
+        new_duration = recorder.get_duration() if recorder.is_recording else "00:00:00"
+        if new_duration != self._last_duration_str:
+            self._duration_label.update(new_duration)
+            self._last_duration_str = new_duration
+
+    def _update_buttons_and_status(self) -> None:
+        """Update status label, classes, and buttons on a state transition."""
+        recorder = self._recorder
+
+        new_state = (recorder.is_recording, recorder.is_paused)
+        if new_state == self._last_state:
+            return
+        self._last_state = new_state
+
+        status_label = self._status_label
+
+        # Defer the repaint so the batch of widget mutations causes a
+        # single compositor pass
+        with self._app.batch_update():
+            if recorder.is_recording:
+                status_label.update(
+                    "Status: PAUSED" if recorder.is_paused else "Status: RECORDING"
+                )
+
+                # add/remove_class still costs style recomputation even when the
+                # class is already present, so only touch it on transitions
+                if not self._recording_class_applied:
+                    status_label.add_class("recording")
+                    self._recording_box.add_class("recording")
+                    self._recording_class_applied = True
+
+                new_label = "Resume" if recorder.is_paused else "Pause"
+                if str(self._pause_btn.label) != new_label:
+                    self._pause_btn.label = new_label
+
+                self._start_btn.disabled = True
+                self._stop_btn.disabled = False
+                self._pause_btn.disabled = False
+                self._start_timer()
+            else:
+                status_label.update("Status: Idle")
+
+                if self._recording_class_applied:
+                    status_label.remove_class("recording")
+                    self._recording_box.remove_class("recording")
+                    self._recording_class_applied = False
+
+                self._start_btn.disabled = False
+                self._stop_btn.disabled = True
+                self._pause_btn.disabled = True
+                if str(self._pause_btn.label) != "Pause":
+                    self._pause_btn.label = "Pause"
+                self._stop_timer()
+
+        self._update_duration_only()
+
+    _BUTTON_ACTIONS = {
+        "start-btn": "start_recording",
+        "stop-btn": "stop_recording",
+        "pause-btn": "toggle_pause",
+        "back-btn": "go_back",
+    }
+
+    async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        button_id = event.button.id
-
-        if button_id == "start-btn":
-            self.action_start_recording()
-        elif button_id == "stop-btn":
-            self.action_stop_recording()
-        elif button_id == "pause-btn":
-            self.action_toggle_pause()
-        elif button_id == "back-btn":
-            self.action_go_back()
-
-    def action_start_recording(self) -> None:
+        action = self._BUTTON_ACTIONS.get(event.button.id)
+        if action:
+            result = getattr(self, f"action_{action}")()
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def action_start_recording(self) -> None:
         """Start recording."""
-        app = self.app
         try:
-            file = app.recorder.start()
-            self._update_display()
+            # Device probe can block for tens of milliseconds
+            file = await asyncio.to_thread(self._recorder.start)
             self.notify(f"Recording started: {file.name}", severity="information")
         except Exception as e:
             self.notify(f"Error: {e}", severity="error")
 
-    def action_stop_recording(self) -> None:
+    async def action_stop_recording(self) -> None:
         """Stop recording."""
-        app = self.app
         try:
-            file = app.recorder.stop()
+            # stop() signals ffmpeg and waits for it to flush the file
+            file = await asyncio.to_thread(self._recorder.stop)
             if file:
-                app.db.add_audio(file)
+                # SQLite insert can fsync; keep it off the event loop
+                await asyncio.to_thread(self._db.add_audio, file)
                 self.notify(f"Saved: {file.name}", severity="information")
-            self._update_display()
         except Exception as e:
             self.notify(f"Error: {e}", severity="error")
 
-    def action_toggle_recording(self) -> None:
+    async def action_toggle_recording(self) -> None:
         """Toggle recording state."""
-        if self.is_recording:
-            self.action_stop_recording()
+        if self._recorder.is_recording:
+            await self.action_stop_recording()
         else:
-            self.action_start_recording()
+            await self.action_start_recording()
 
     def action_toggle_pause(self) -> None:
         """Toggle pause/resume on the current recording."""
-        recorder = self.app.recorder
+        recorder = self._recorder
         if not recorder.is_recording:
             return
         if recorder.is_paused:
@@ -134,7 +196,6 @@ class RecordingScreen(Screen):
         else:
             recorder.pause()
             self.notify("Recording paused", severity="information")
-        self._update_display()
 
     def action_go_back(self) -> None:
         """Go back to main menu."""
@@ -1,21 +1,60 @@
 """Unified Files & Labels screen for Transcribe TUI."""
 
 import functools
+import itertools
+import os
 import re
+import subprocess
+import threading
+from datetime import datetime
 from pathlib import Path
-from threading import Timer
 
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical, VerticalScroll
 from textual.coordinate import Coordinate
+from textual.timer import Timer
 from textual.screen import Screen
 from textual.events import Resize
 from textual.widgets import Button, DataTable, Footer, Header, Input, Label, Static
 from textual.worker import Worker
 
-from ..core import Summarizer
-from ..models import TranscriptData
+from ..core import Summarizer, Transcriber
+from ..models import TranscriptData, UnifiedItem
+from ._progress import throttled_progress
+
+# Leading YYYY-MM-DD date in transcript/recording filenames
+_DATE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})")
+
+# Sample utterances longer than this are truncated with an ellipsis
+_MAX_SAMPLE_LEN = 80
+_SAMPLE_TRUNC = _MAX_SAMPLE_LEN - 3
+
+# Parsed transcripts keyed by path, with the file mtime at parse time so
+# edits made outside the app invalidate the entry.
+_transcript_cache: dict[str, tuple[float, TranscriptData]] = {}
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_duration(seconds: int) -> str:
+    """Format duration in seconds to MM:SS or HH:MM:SS."""
+    if seconds < 3600:
+        return f"{seconds // 60}:{seconds % 60:02d}"
+    hours = seconds // 3600
+    minutes = (seconds % 3600) // 60
+    secs = seconds % 60
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def _load_transcript_cached(path: Path) -> TranscriptData:
+    """Load a transcript, reusing the parsed data if the file is unchanged."""
+    mtime = path.stat().st_mtime
+    cached = _transcript_cache.get(str(path))
+    if cached and cached[0] == mtime:
+        return cached[1]
+    data = TranscriptData.load(path)
+    _transcript_cache[str(path)] = (mtime, data)
+    return data
 
 
 class UnifiedScreen(Screen):
@@ -38,25 +77,58 @@ class UnifiedScreen(Screen):
     ]
 
     AUDIO_EXTENSIONS = {"mp4", "m4a", "mp3", "wav", "ogg", "webm", "flac"}
+    # endswith with a tuple is a single C-level check per entry, versus
+    # splitting out and lowering the suffix in Python first
+    AUDIO_SUFFIXES = tuple(f".{ext}" for ext in sorted(AUDIO_EXTENSIONS))
+
+    # Adaptive refresh cadence: backs off while refreshes produce no changes
+    REFRESH_INTERVAL = 60.0
+    REFRESH_INTERVAL_MAX = 600.0
+
+    # Rows added to the table per page; more are paged in as the cursor
+    # approaches the bottom of the loaded window
+    ROW_PAGE = 200
 
     def __init__(self):
         super().__init__()
-        self.items: list[dict] = []  # Combined list of audio files and transcripts
+        self.items: list[UnifiedItem] = []  # Combined list of audio files and transcripts
         self.current_transcript: TranscriptData | None = None
         self.current_transcript_path: Path | None = None
         self.current_speaker_index: int = 0
         self.sample_offset: int = 0
         self._delete_pending_path: str | None = None
         self._delete_timer: Timer | None = None
-
-    def _format_duration(self, seconds: int) -> str:
-        """Format duration in seconds to MM:SS or HH:MM:SS."""
-        if seconds < 3600:
-            return f"{seconds // 60}:{seconds % 60:02d}"
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        return f"{hours}:{minutes:02d}:{secs:02d}"
+        self._row_snapshot: dict[str, tuple] = {}
+        self._full_snapshot: dict[str, tuple] = {}
+        self._items_by_key: dict[str, UnifiedItem] = {}
+        self._visible_rows: int = self.ROW_PAGE
+        self._total_rows: int = 0
+        self._last_db_token: tuple[int, int] | None = None
+        self._last_dir_mtime: int = -1
+        self._last_speaker_shown: int | None = None
+        self._speaker_utterances: dict[str, list[str]] = {}
+        self._unlabeled_remaining: int = 0
+        self._summarizer: Summarizer | None = None
+        self._transcriber: Transcriber | None = None
+        self._transcriber_key: str | None = None
+        # Workers are threaded, so first-use construction needs a lock
+        self._client_lock = threading.Lock()
+        self._current_summary_path: str | None = None
+
+    def _get_summarizer(self) -> Summarizer:
+        """Return the shared Summarizer, creating it on first use."""
+        with self._client_lock:
+            if self._summarizer is None:
+                self._summarizer = Summarizer()
+            return self._summarizer
+
+    def _get_transcriber(self, api_key: str) -> Transcriber:
+        """Return the shared Transcriber, rebuilding it if the key changed."""
+        with self._client_lock:
+            if self._transcriber is None or self._transcriber_key != api_key:
+                self._transcriber = Transcriber(api_key)
+                self._transcriber_key = api_key
+            return self._transcriber
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -91,106 +163,292 @@ class UnifiedScreen(Screen):
 
     def on_mount(self) -> None:
         """Called when screen is mounted."""
-        self.query_one("#size-warning", Static).display = False
-        self.query_one("#worker-status", Static).display = False
-        table = self.query_one("#unified-table", DataTable)
-        table.add_columns("Name", "Filename", "Stage", "Speakers", "Date", "Duration")
+        # Resolve widgets once; they are composed a single time and never
+        # replaced, so repeated query_one selector walks are pure overhead
+        self._table = self.query_one("#unified-table", DataTable)
+        self._transcript_name_label = self.query_one("#transcript-name", Label)
+        self._speaker_label = self.query_one("#speaker-id", Label)
+        self._samples_content = self.query_one("#samples-content", Static)
+        self._speaker_input = self.query_one("#speaker-input", Input)
+        self._summary_btn = self.query_one("#summary-btn", Button)
+        self._regen_btn = self.query_one("#regen-btn", Button)
+        self._worker_status = self.query_one("#worker-status", Static)
+        self._size_warning = self.query_one("#size-warning", Static)
+        self._container = self.query_one("#unified-container", Container)
+
+        self._size_warning.display = False
+        self._worker_status.display = False
+        table = self._table
+        self._column_keys = table.add_columns(
+            "Name", "Filename", "Stage", "Speakers", "Date", "Duration"
+        )
         table.cursor_type = "row"
+        self._refresh_interval = self.REFRESH_INTERVAL
+        self._refresh_timer: Timer | None = None
+        self._refresh_debounce: Timer | None = None
         self._refresh_table()
-        self.set_interval(60.0, self._refresh_table)
+        self._schedule_refresh()
+
+    def _schedule_refresh(self, *, reset: bool = False) -> None:
+        """(Re)arm the periodic refresh timer."""
+        if reset:
+            self._refresh_interval = self.REFRESH_INTERVAL
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(
+            self._refresh_interval, self._periodic_refresh
+        )
+
+    def _request_refresh(self) -> None:
+        """Coalesce refresh requests within a short window into one pass.
+
+        Actions that finish close together (e.g. several transcriptions
+        completing) each request a refresh; only the first arms the
+        timer, so the burst costs a single scan and repaint.
+        """
+        if self._refresh_debounce is None:
+            self._refresh_debounce = self.set_timer(0.3, self._debounced_refresh)
+
+    def _debounced_refresh(self) -> None:
+        """Timer callback for coalesced refresh requests."""
+        self._refresh_debounce = None
+        self._schedule_refresh(reset=True)
+        self._start_refresh_worker()
+
+    def _periodic_refresh(self) -> None:
+        """Timer callback: refresh in a worker, backing off while idle."""
+        self._start_refresh_worker(rearm=True)
+
+    def _start_refresh_worker(self, *, rearm: bool = False) -> None:
+        """Run the scan in a thread so slow disks never stall keypresses.
+
+        exclusive=True cancels a stale in-flight scan if ticks overlap.
+        """
+        self.run_worker(
+            functools.partial(self._refresh_worker, rearm),
+            name="refresh",
+            exclusive=True,
+            thread=True,
+        )
 
-    def _refresh_table(self) -> None:
-        """Refresh the combined table with audio files and transcripts."""
+    def _refresh_worker(self, rearm: bool) -> None:
+        """Worker body: scan off-thread, then apply on the UI thread."""
+        try:
+            items = self._refresh_scan()
+        except Exception as e:
+            self.app.call_from_thread(
+                self.notify, f"Error refreshing: {e}", severity="error"
+            )
+            items = None
+        self.app.call_from_thread(self._refresh_finish, items, rearm)
+
+    def _refresh_finish(self, items: list[UnifiedItem] | None, rearm: bool) -> None:
+        """Apply a worker scan result and manage the back-off interval."""
+        changed = self._refresh_apply(items) if items is not None else False
+        if not rearm:
+            return
+        if changed:
+            self._refresh_interval = self.REFRESH_INTERVAL
+        else:
+            self._refresh_interval = min(
+                self._refresh_interval * 2, self.REFRESH_INTERVAL_MAX
+            )
+        self._refresh_timer = self.set_timer(
+            self._refresh_interval, self._periodic_refresh
+        )
+
+    def _refresh_table(self, force: bool = False) -> bool:
+        """Refresh the combined table synchronously (UI-thread callers).
+
+        Args:
+            force: Rebuild even when no change is detected (used when the
+                paging window grows or the user asks for a refresh).
+
+        Returns:
+            True if anything in the table changed.
+        """
+        try:
+            items = self._refresh_scan(force)
+            if items is None:
+                return False
+            return self._refresh_apply(items)
+        except Exception as e:
+            self.notify(f"Error refreshing: {e}", severity="error")
+            return False
+
+    def _refresh_scan(self, force: bool = False) -> list[UnifiedItem] | None:
+        """Query the DB and scan the watch dir for the current item list.
+
+        Pure I/O, no widget access, so it is safe to run off the UI
+        thread.
+
+        Returns:
+            The fresh item list, or None when nothing has changed and
+            force is not set.
+        """
+        # Cheap change detection: when neither the database nor the
+        # watch directory has changed since the last pass, skip the
+        # query and rescan entirely
+        watch_dir = self.app.config.watch_dir
         try:
-            table = self.query_one("#unified-table", DataTable)
-            table.clear()
-
-            # Get unified list from database
-            self.items = self.app.db.list_unified()
-
-            # Also scan filesystem for new audio files not in DB
-            watch_dir = self.app.config.watch_dir
-            if watch_dir.exists():
-                db_audio_paths = {
-                    item["audio_path"]
-                    for item in self.items
-                    if item.get("audio_path")
-                }
-                for file in watch_dir.iterdir():
+            dir_mtime = watch_dir.stat().st_mtime_ns
+        except OSError:
+            dir_mtime = -1
+        db_token = self.app.db.change_token()
+        if (
+            not force
+            and db_token == self._last_db_token
+            and dir_mtime == self._last_dir_mtime
+        ):
+            return None
+        self._last_dir_mtime = dir_mtime
+
+        # Get unified list from database
+        items = self.app.db.list_unified()
+
+        # Also scan filesystem for new audio files not in DB; the
+        # table's UNIQUE constraint does the de-dup, so no path set
+        # needs to be rebuilt per tick
+        if dir_mtime != -1:
+            # os.scandir yields cached file-type info, so this is one
+            # directory read instead of a stat per entry.
+            with os.scandir(watch_dir) as entries:
+                for entry in entries:
                     if (
-                        file.is_file()
-                        and file.suffix.lower().lstrip(".") in self.AUDIO_EXTENSIONS
-                        and str(file) not in db_audio_paths
+                        entry.is_file(follow_symlinks=False)
+                        and entry.name.lower().endswith(self.AUDIO_SUFFIXES)
+                        and self.app.db.add_audio_if_new(entry.path) is not None
                     ):
-                        # Add to database and items list
-                        self.app.db.add_audio(str(file))
-                        self.items.append({
-                            "type": "audio",
-                            "audio_path": str(file),
-                            "audio_filename": file.name,
-                            "stage": "to transcribe",
-                            "speakers": None,
-                            "date": None,
-                            "duration": None,
-                            "name": file.name,
-                            "transcript_path": None,
-                        })
+                        items.append(
+                            UnifiedItem(
+                                type="audio",
+                                audio_path=entry.path,
+                                audio_filename=entry.name,
+                                stage="to transcribe",
+                                # DirEntry.stat() reuses the inode info
+                                # cached from the directory read
+                                date=datetime.fromtimestamp(
+                                    entry.stat().st_mtime
+                                ).strftime("%Y-%m-%d %H:%M"),
+                                name=entry.name,
+                            )
+                        )
+
+        # Re-read after the scan: add_audio calls above bump the token
+        self._last_db_token = self.app.db.change_token()
+        return items
+
+    def _refresh_apply(self, items: list[UnifiedItem]) -> bool:
+        """Rebuild or diff the table from a scan result (UI thread only).
+
+        Returns:
+            True if anything in the table changed.
+        """
+        try:
+            table = self._table
+            self.items = items
+            self._items_by_key = {}
 
             if not self.items:
+                changed = bool(self._full_snapshot)
+                table.clear()
+                self._row_snapshot = {}
+                self._full_snapshot = {}
                 table.add_row("No files or transcripts", "-", "-", "-", "-", "-")
-                return
+                return changed
 
+            new_rows: dict[str, tuple] = {}
             for item in self.items:
-                name = item.get("name") or item.get("audio_filename") or "-"
-                filename = item.get("audio_filename") or (
-                    Path(item["transcript_path"]).name if item.get("transcript_path") else "-"
+                name = item.name or item.audio_filename or "-"
+                filename = item.audio_filename or (
+                    os.path.basename(item.transcript_path) if item.transcript_path else "-"
                 )
-                stage = item.get("stage", "-")
-                speakers = item.get("speakers") or "-"
-                date = item.get("date") or "-"
-                dur_secs = item.get("duration_seconds")
-                duration = self._format_duration(dur_secs) if dur_secs else "-"
+                stage = item.stage
+                speakers = item.speakers or "-"
+                date = item.date or "-"
+                dur_secs = item.duration_seconds
+                duration = _format_duration(dur_secs) if dur_secs else "-"
 
                 # Create a unique key
-                key = item.get("transcript_path") or item.get("audio_path") or filename
-
-                table.add_row(name, filename, stage, speakers, date, duration, key=key)
+                key = item.transcript_path or item.audio_path or filename
+                new_rows[key] = (name, filename, stage, speakers, date, duration)
+                self._items_by_key[key] = item
+
+            # Change detection runs against the full row set, before the
+            # paging truncation below: an update beyond the visible window
+            # (e.g. a new file appended past the last page) must still
+            # reset the refresh back-off.
+            self._total_rows = len(new_rows)
+            changed = new_rows != self._full_snapshot
+            self._full_snapshot = new_rows
+
+            # Only materialize rows up to the current paging window; large
+            # histories would otherwise block the UI building widgets for
+            # rows nobody has scrolled to
+            if self._total_rows > self._visible_rows:
+                new_rows = dict(itertools.islice(new_rows.items(), self._visible_rows))
+
+            # Suspend repaints while mutating so N row/cell changes cost
+            # one reflow instead of one per call
+            with self.app.batch_update():
+                if list(new_rows) != list(self._row_snapshot):
+                    # Rows appeared, vanished, or reordered: rebuild wholesale
+                    table.clear()
+                    for key, values in new_rows.items():
+                        table.add_row(*values, key=key)
+                else:
+                    # Same rows in the same order (the common case for the 60s
+                    # interval refresh): touch only cells that actually changed
+                    for key, values in new_rows.items():
+                        old_values = self._row_snapshot[key]
+                        if values == old_values:
+                            continue
+                        for col_key, old, new in zip(
+                            self._column_keys, old_values, values
+                        ):
+                            if old != new:
+                                table.update_cell(key, col_key, new, update_width=True)
+
+            self._row_snapshot = new_rows
+            return changed
 
         except Exception as e:
             self.notify(f"Error refreshing: {e}", severity="error")
+            return False
 
-    def _get_selected_item(self) -> dict | None:
+    def _get_selected_item(self) -> UnifiedItem | None:
         """Get the currently selected item."""
-        table = self.query_one("#unified-table", DataTable)
+        table = self._table
         if table.row_count == 0:
             return None
 
         cell_key = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0))
-        row_key = cell_key.row_key
-        if not row_key:
-            return None
+        # row_key.value is the exact string passed to add_row(key=...),
+        # so no str() round-trip is needed
+        key = cell_key.row_key.value
+        return self._items_by_key.get(key) if key else None
 
-        key = str(row_key.value)
-        for item in self.items:
-            item_key = item.get("transcript_path") or item.get("audio_path")
-            if item_key == key:
-                return item
-        return None
-
-    def _get_primary_file_path(self, item: dict) -> tuple[Path | None, str]:
+    def _get_primary_file_path(self, item: UnifiedItem) -> tuple[Path | None, str]:
         """Get the primary file path for an item (summary > transcript > audio).
 
         Returns (path, description) where description is 'summary', 'transcript', or 'audio'.
         """
         # Priority: summary (most useful) > transcript > audio
-        if item.get("summary_path"):
-            return Path(item["summary_path"]), "summary"
-        elif item.get("transcript_path"):
-            return Path(item["transcript_path"]), "transcript"
-        elif item.get("audio_path"):
-            return Path(item["audio_path"]), "audio"
+        if item.summary_path:
+            return Path(item.summary_path), "summary"
+        elif item.transcript_path:
+            return Path(item.transcript_path), "transcript"
+        elif item.audio_path:
+            return Path(item.audio_path), "audio"
         return None, ""
 
+    def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
+        """Page in another window of rows when the cursor nears the bottom."""
+        loaded = len(self._row_snapshot)
+        if loaded < self._total_rows and event.cursor_row >= loaded - 5:
+            self._visible_rows += self.ROW_PAGE
+            self._refresh_table(force=True)
+
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection."""
         item = self._get_selected_item()
@@ -198,34 +456,86 @@ class UnifiedScreen(Screen):
             return
 
         # If it's a transcript, load it for labeling
-        transcript_path = item.get("transcript_path")
+        transcript_path = item.transcript_path
         if transcript_path and Path(transcript_path).exists():
             self._load_transcript(Path(transcript_path))
         else:
             # Clear transcript form
             self.current_transcript = None
             self.current_transcript_path = None
-            name_label = self.query_one("#transcript-name", Label)
-            name_label.update("Select a transcript to label")
-            speaker_label = self.query_one("#speaker-id", Label)
-            speaker_label.update("")
-            samples_content = self.query_one("#samples-content", Static)
-            samples_content.update("")
+            self._transcript_name_label.update("Select a transcript to label")
+            self._speaker_label.update("")
+            self._samples_content.update("")
 
     def _load_transcript(self, path: Path) -> None:
         """Load a transcript for labeling."""
         try:
-            self.current_transcript = TranscriptData.load(path)
+            self.current_transcript = _load_transcript_cached(path)
             self.current_transcript_path = path
+            # Fetched once per load; save/regenerate reuse it instead of
+            # re-querying the DB
+            self._current_summary_path = self.app.db.get_summary_path(str(path))
             self.current_speaker_index = 0
             self.sample_offset = 0
+            self._last_speaker_shown = None
+            self._unlabeled_remaining = sum(
+                1 for s in self.current_transcript.speakers if not s.name
+            )
+            self._rebuild_speaker_utterances()
             self._show_current_speaker()
 
-            name_label = self.query_one("#transcript-name", Label)
-            name_label.update(f"Transcript: {path.name}")
+            self._transcript_name_label.update(f"Transcript: {path.name}")
         except Exception as e:
             self.notify(f"Error loading transcript: {e}", severity="error")
 
+    def _rebuild_speaker_utterances(self) -> None:
+        """Index utterance texts by speaker value.
+
+        One O(U) pass per load/save instead of re-filtering the full
+        utterance list on every speaker navigation.
+        """
+        index: dict[str, list[str]] = {}
+        for utt in self.current_transcript.utterances:
+            index.setdefault(utt.speaker, []).append(utt.text)
+        self._speaker_utterances = index
+
+    def _get_speaker_samples(
+        self, speaker, num_samples: int = 3, offset: int = 0
+    ) -> list[str]:
+        """Slice cached sample utterances for a speaker.
+
+        Utterances are keyed by ID before labeling and by the assigned
+        name afterwards, so look under both.
+        """
+        texts = self._speaker_utterances.get(speaker.id, [])
+        if speaker.name and speaker.name != speaker.id:
+            named = self._speaker_utterances.get(speaker.name)
+            if named:
+                texts = texts + named
+        return texts[offset : offset + num_samples]
+
+    def _refresh_samples_only(self) -> None:
+        """Update just the sample-utterances panel for the current speaker."""
+        if not self.current_transcript:
+            return
+
+        speaker = self.current_transcript.speakers[self.current_speaker_index]
+        samples = self._get_speaker_samples(
+            speaker, num_samples=3, offset=self.sample_offset
+        )
+        samples_content = self._samples_content
+
+        if samples:
+            parts = ["Sample utterances:"]
+            for s in samples:
+                if len(s) > _MAX_SAMPLE_LEN:
+                    s = s[:_SAMPLE_TRUNC] + "..."
+                parts.append(f'  * "{s}"')
+            parts.append("")
+            samples_content.update("\n".join(parts))
+        else:
+            samples_content.update("No sample utterances available")
+
     def _show_current_speaker(self) -> None:
         """Display the current speaker for labeling."""
         if not self.current_transcript:
@@ -235,79 +545,64 @@ class UnifiedScreen(Screen):
             self.current_speaker_index = 0
 
         speaker = self.current_transcript.speakers[self.current_speaker_index]
+        index_changed = self.current_speaker_index != self._last_speaker_shown
+
+        if index_changed:
+            # Update speaker ID display
+            speaker_label = self._speaker_label
+            total = len(self.current_transcript.speakers)
+            speaker_label.update(
+                f"Speaker {self.current_speaker_index + 1} of {total}: {speaker.id}"
+            )
 
-        # Update speaker ID display
-        speaker_label = self.query_one("#speaker-id", Label)
-        total = len(self.current_transcript.speakers)
-        speaker_label.update(
-            f"Speaker {self.current_speaker_index + 1} of {total}: {speaker.id}"
-        )
+        self._refresh_samples_only()
 
-        # Get and display samples
-        samples = self.current_transcript.get_speaker_samples(
-            speaker.id, num_samples=3, offset=self.sample_offset
-        )
-        samples_content = self.query_one("#samples-content", Static)
+        if index_changed:
+            # Update input with current name
+            name_input = self._speaker_input
+            name_input.value = speaker.name or ""
+            name_input.focus()
 
-        if samples:
-            sample_text = "Sample utterances:\n"
-            for s in samples:
-                if len(s) > 80:
-                    s = s[:77] + "..."
-                sample_text += f"  * \"{s}\"\n"
-            samples_content.update(sample_text)
-        else:
-            samples_content.update("No sample utterances available")
-
-        # Update input with current name
-        name_input = self.query_one("#speaker-input", Input)
-        name_input.value = speaker.name or ""
-        name_input.focus()
+        self._last_speaker_shown = self.current_speaker_index
 
     def _save_current_speaker_name(self) -> None:
         """Save the current speaker name from input."""
         if not self.current_transcript:
             return
 
-        name_input = self.query_one("#speaker-input", Input)
-        name = name_input.value.strip()
+        name = self._speaker_input.value.strip()
 
         if name:
             speaker = self.current_transcript.speakers[self.current_speaker_index]
+            if not speaker.name:
+                self._unlabeled_remaining -= 1
             self.current_transcript.set_speaker_name(speaker.id, name)
 
     def _all_speakers_labeled(self) -> bool:
-        """Check if all speakers have names assigned."""
+        """Check if all speakers have names assigned (O(1) via cached count)."""
         if not self.current_transcript:
             return False
-        return all(s.name for s in self.current_transcript.speakers)
+        return self._unlabeled_remaining == 0
+
+    _BUTTON_ACTIONS = {
+        "transcribe-btn": "transcribe_selected",
+        "delete-btn": "delete_selected",
+        "refresh-btn": "refresh",
+        "open-btn": "open_folder",
+        "prev-btn": "prev_speaker",
+        "next-btn": "next_speaker",
+        "more-btn": "more_samples",
+        "save-btn": "save_labels",
+        "summary-btn": "generate_summary",
+        "regen-btn": "regenerate_summary",
+        "back-btn": "go_back",
+    }
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
-        button_id = event.button.id
-
-        if button_id == "transcribe-btn":
-            self.action_transcribe_selected()
-        elif button_id == "delete-btn":
-            self.action_delete_selected()
-        elif button_id == "refresh-btn":
-            self.action_refresh()
-        elif button_id == "open-btn":
-            self.action_open_folder()
-        elif button_id == "prev-btn":
-            self.action_prev_speaker()
-        elif button_id == "next-btn":
-            self.action_next_speaker()
-        elif button_id == "more-btn":
-            self.action_more_samples()
-        elif button_id == "save-btn":
-            self.action_save_labels()
-        elif button_id == "summary-btn":
-            self.action_generate_summary()
-        elif button_id == "regen-btn":
-            self.action_regenerate_summary()
-        elif button_id == "back-btn":
-            self.action_go_back()
+        action = self._BUTTON_ACTIONS.get(event.button.id)
+        if action:
+            getattr(self, f"action_{action}")()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle enter in input field - move to next speaker."""
@@ -323,12 +618,12 @@ class UnifiedScreen(Screen):
             self.notify("No item selected", severity="warning")
             return
 
-        audio_path = item.get("audio_path")
+        audio_path = item.audio_path
         if not audio_path:
             self.notify("Select an audio file to transcribe", severity="warning")
             return
 
-        if item.get("stage") not in ("to transcribe", "pending"):
+        if item.stage not in ("to transcribe", "pending"):
             self.notify("File already transcribed", severity="warning")
             return
 
@@ -338,27 +633,23 @@ class UnifiedScreen(Screen):
             self.notify("AssemblyAI API key not configured", severity="error")
             return
 
-        self.notify(f"Starting transcription: {Path(audio_path).name}")
-
-        from ..core import Transcriber
+        filename = os.path.basename(audio_path)
+        self.notify(f"Starting transcription: {filename}")
 
         self.run_worker(
             functools.partial(self._transcribe_file, audio_path, api_key),
             name="transcribe",
-            description=f"Transcribing {Path(audio_path).name}",
+            description=f"Transcribing {filename}",
             thread=True,
         )
 
     def _transcribe_file(self, path: str, api_key: str) -> None:
         """Transcribe a file (runs in worker thread)."""
-        from ..core import Transcriber
-
         try:
-            transcriber = Transcriber(api_key)
+            transcriber = self._get_transcriber(api_key)
             output_dir = self.app.config.raw_transcripts_dir
 
-            def progress(msg: str) -> None:
-                self.app.call_from_thread(self.notify, msg, severity="information")
+            progress = throttled_progress(self.app, self.notify)
 
             transcript_path = transcriber.transcribe_and_save(path, output_dir, progress)
 
@@ -370,7 +661,7 @@ class UnifiedScreen(Screen):
             self.app.call_from_thread(
                 self.notify, f"Transcription complete: {transcript_path.name}"
             )
-            self.app.call_from_thread(self._refresh_table)
+            self.app.call_from_thread(self._request_refresh)
 
         except Exception as e:
             self.app.call_from_thread(
@@ -381,7 +672,7 @@ class UnifiedScreen(Screen):
         """Reset the pending delete state."""
         self._delete_pending_path = None
         if self._delete_timer:
-            self._delete_timer.cancel()
+            self._delete_timer.stop()
             self._delete_timer = None
 
     def action_delete_selected(self) -> None:
@@ -391,38 +682,36 @@ class UnifiedScreen(Screen):
             self.notify("No item selected", severity="warning")
             return
 
-        audio_path = item.get("audio_path")
+        audio_path = item.audio_path
         if not audio_path:
             return
 
         if self._delete_pending_path == audio_path:
             # Second press: execute delete
             self._reset_delete_pending()
-            path = Path(audio_path)
-            if path.exists():
-                path.unlink()
+            try:
+                # One syscall instead of stat + unlink, and no TOCTOU window
+                os.unlink(audio_path)
+            except FileNotFoundError:
+                pass
             self.app.db.delete_audio(audio_path)
-            self.notify(f"Deleted: {path.name}")
-            self._refresh_table()
+            self.notify(f"Deleted: {os.path.basename(audio_path)}")
+            self._request_refresh()
         else:
             # First press: arm deletion
             self._reset_delete_pending()
             self._delete_pending_path = audio_path
-            self._delete_timer = Timer(
-                3.0, lambda: self.app.call_from_thread(self._reset_delete_pending)
-            )
-            self._delete_timer.daemon = True
-            self._delete_timer.start()
+            # Textual's event-loop timer avoids spawning an OS thread per
+            # armed delete and needs no call_from_thread marshalling
+            self._delete_timer = self.set_timer(3.0, self._reset_delete_pending)
             self.notify(
-                f"Press Alt+D again to confirm deletion of {Path(audio_path).name}",
+                f"Press Alt+D again to confirm deletion of {os.path.basename(audio_path)}",
                 severity="warning",
                 timeout=3,
             )
 
     def action_open_folder(self) -> None:
         """Open the watch directory in file manager."""
-        import subprocess
-
         watch_dir = self.app.config.watch_dir
         if watch_dir.exists():
             subprocess.Popen(["xdg-open", str(watch_dir)])
@@ -432,8 +721,6 @@ class UnifiedScreen(Screen):
 
     def action_copy_path(self) -> None:
         """Copy the selected file path to clipboard."""
-        import subprocess
-
         item = self._get_selected_item()
         if not item:
             self.notify("No item selected", severity="warning")
@@ -458,8 +745,6 @@ class UnifiedScreen(Screen):
 
     def action_show_in_files(self) -> None:
         """Open file manager with the selected file highlighted."""
-        import subprocess
-
         item = self._get_selected_item()
         if not item:
             self.notify("No item selected", severity="warning")
@@ -522,13 +807,13 @@ class UnifiedScreen(Screen):
 
         speaker = self.current_transcript.speakers[self.current_speaker_index]
         self.sample_offset += 3
-        samples = self.current_transcript.get_speaker_samples(
-            speaker.id, num_samples=3, offset=self.sample_offset
+        samples = self._get_speaker_samples(
+            speaker, num_samples=3, offset=self.sample_offset
         )
         if not samples:
             self.sample_offset = 0
             self.notify("Wrapped to first samples")
-        self._show_current_speaker()
+        self._refresh_samples_only()
 
     def _build_speaker_rename_map(self) -> dict[str, str]:
         """Build a mapping of old speaker names to new names from current utterances.
@@ -538,9 +823,14 @@ class UnifiedScreen(Screen):
         """
         rename_map = {}
         # Collect current (old) speaker values from utterances
-        old_speakers_in_utts = {utt.speaker for utt in self.current_transcript.utterances}
+        old_speakers_in_utts = frozenset(
+            utt.speaker for utt in self.current_transcript.utterances
+        )
         # Map: speaker.id -> speaker.name (new)
         id_to_new = {s.id: s.name for s in self.current_transcript.speakers if s.name}
+        # Utterance values that don't match any speaker id are previous names
+        # left behind by a relabel; computed once instead of per speaker
+        stale_names = [n for n in old_speakers_in_utts if n not in id_to_new]
         # Map: old utterance speaker -> new name
         # If utterance speaker matches an ID, the new name is id_to_new[id]
         # If utterance speaker is an old name (already labeled), find which speaker
@@ -549,34 +839,36 @@ class UnifiedScreen(Screen):
             if not speaker.name:
                 continue
             # The utterance might use speaker.id (unlabeled) or an old name (relabeled)
-            if speaker.id in old_speakers_in_utts and speaker.name != speaker.id:
-                rename_map[speaker.id] = speaker.name
-            # Check if old name is in utterances (relabeling case)
-            for old_name in old_speakers_in_utts:
-                if old_name == speaker.id:
-                    continue
-                # This old_name belongs to this speaker if it was their previous name
-                # We detect this by checking: no other speaker has this as their id,
-                # and this speaker's id is absent from utterances
-                if (old_name not in id_to_new
-                        and speaker.id not in old_speakers_in_utts
-                        and old_name != speaker.name):
+            if speaker.id in old_speakers_in_utts:
+                if speaker.name != speaker.id:
+                    rename_map[speaker.id] = speaker.name
+                continue
+            # Relabeling case: this speaker's id is absent from utterances, so
+            # any stale name that isn't already theirs maps to their new name
+            for old_name in stale_names:
+                if old_name != speaker.name:
                     rename_map[old_name] = speaker.name
         return rename_map
 
     def _update_summary_file(self, rename_map: dict[str, str]) -> None:
         """Update speaker names in the summary file using regex replacement."""
-        summary_path_str = self.app.db.get_summary_path(str(self.current_transcript_path))
+        summary_path_str = self._current_summary_path
         if not summary_path_str:
             return
         summary_path = Path(summary_path_str)
         if not summary_path.exists():
             return
 
-        content = summary_path.read_text()
-        for old_name, new_name in rename_map.items():
-            content = re.sub(rf"\b{re.escape(old_name)}\b", new_name, content)
-        summary_path.write_text(content)
+        # One alternation pattern replaces every name in a single pass over
+        # the content, instead of recompiling and rescanning per name
+        pattern = re.compile(
+            r"\b(" + "|".join(re.escape(name) for name in rename_map) + r")\b"
+        )
+        content = summary_path.read_text(encoding="utf-8")
+        new_content, count = pattern.subn(lambda m: rename_map[m.group(1)], content)
+        if count:
+            # Skip the disk write when no names actually appeared
+            summary_path.write_text(new_content, encoding="utf-8")
 
     def action_save_labels(self) -> None:
         """Save all labels to the transcript file."""
@@ -589,24 +881,32 @@ class UnifiedScreen(Screen):
         # Build rename map before replacing speaker values
         rename_map = self._build_speaker_rename_map()
 
-        # Check if all speakers are labeled
-        all_labeled = all(s.name for s in self.current_transcript.speakers)
+        # Check if all speakers are labeled (O(1) via cached count)
+        all_labeled = self._all_speakers_labeled()
 
         # Replace speaker IDs/old names with new names in utterances
         self.current_transcript.replace_speaker_ids_with_names()
-        # Also replace old names with new names for relabeling
-        for old_name, new_name in rename_map.items():
-            for utt in self.current_transcript.utterances:
-                if utt.speaker == old_name:
-                    utt.speaker = new_name
+        # Also replace old names with new names for relabeling (single pass,
+        # one dict lookup per utterance)
+        for utt in self.current_transcript.utterances:
+            new_name = rename_map.get(utt.speaker)
+            if new_name is not None:
+                utt.speaker = new_name
+        # Utterance speaker values just changed, so re-key the sample index
+        self._rebuild_speaker_utterances()
 
         if all_labeled:
             self.current_transcript.mark_labeled()
             speaker_names = ", ".join(self.current_transcript.get_participants())
             self.app.db.mark_labeled(str(self.current_transcript_path), speaker_names)
 
-        # Save to file
+        # Save to file, and refresh the load cache in place so the next
+        # reload of this transcript doesn't reparse what we just wrote
         self.current_transcript.save(self.current_transcript_path)
+        _transcript_cache[str(self.current_transcript_path)] = (
+            self.current_transcript_path.stat().st_mtime,
+            self.current_transcript,
+        )
 
         # Update summary file if speaker names changed
         if rename_map:
@@ -614,7 +914,7 @@ class UnifiedScreen(Screen):
             self.notify("Labels and summary updated", severity="information")
         else:
             self.notify("Labels saved", severity="information")
-        self._refresh_table()
+        self._request_refresh()
 
     def action_generate_summary(self) -> None:
         """Generate summary for the current transcript."""
@@ -627,13 +927,13 @@ class UnifiedScreen(Screen):
             return
 
         # Generate title from filename
-        date_match = re.match(r"^(\d{4}-\d{2}-\d{2})", self.current_transcript_path.name)
+        date_match = _DATE_RE.match(self.current_transcript_path.name)
         date = date_match.group(1) if date_match else ""
         participants = "-".join(self.current_transcript.get_participants())
         auto_title = f"{date} {participants}".strip() or "Meeting"
 
         # Disable button and show prominent notification
-        summary_btn = self.query_one("#summary-btn", Button)
+        summary_btn = self._summary_btn
         summary_btn.disabled = True
         summary_btn.label = "Generating..."
 
@@ -653,11 +953,10 @@ class UnifiedScreen(Screen):
     def _generate_summary(self, title: str) -> None:
         """Generate summary (runs in worker thread)."""
         try:
-            summarizer = Summarizer()
+            summarizer = self._get_summarizer()
             output_dir = self.app.config.summaries_dir
 
-            def progress(msg: str) -> None:
-                self.app.call_from_thread(self.notify, msg, severity="information")
+            progress = throttled_progress(self.app, self.notify)
 
             summary_path, generated_title = summarizer.summarize_and_save(
                 self.current_transcript_path,
@@ -672,11 +971,12 @@ class UnifiedScreen(Screen):
             self.app.db.update_meeting_title(
                 str(self.current_transcript_path), generated_title
             )
+            self._current_summary_path = str(summary_path)
 
             self.app.call_from_thread(
                 self.notify, f"Summary saved: {summary_path.name}", severity="information"
             )
-            self.app.call_from_thread(self._refresh_table)
+            self.app.call_from_thread(self._request_refresh)
 
         except Exception as e:
             self.app.call_from_thread(
@@ -684,7 +984,7 @@ class UnifiedScreen(Screen):
             )
         finally:
             def _restore_btn():
-                summary_btn = self.query_one("#summary-btn", Button)
+                summary_btn = self._summary_btn
                 summary_btn.disabled = False
                 summary_btn.label = "\\[Alt+G]enerate Summary"
             self.app.call_from_thread(_restore_btn)
@@ -699,7 +999,7 @@ class UnifiedScreen(Screen):
             self.notify("Please label all speakers first", severity="warning")
             return
 
-        summary_path = self.app.db.get_summary_path(str(self.current_transcript_path))
+        summary_path = self._current_summary_path
         if not summary_path:
             self.notify("No existing summary to regenerate. Use Alt+G to generate.", severity="warning")
             return
@@ -710,12 +1010,12 @@ class UnifiedScreen(Screen):
             old_summary.unlink()
 
         # Generate title from filename
-        date_match = re.match(r"^(\d{4}-\d{2}-\d{2})", self.current_transcript_path.name)
+        date_match = _DATE_RE.match(self.current_transcript_path.name)
         date = date_match.group(1) if date_match else ""
         participants = "-".join(self.current_transcript.get_participants())
         auto_title = f"{date} {participants}".strip() or "Meeting"
 
-        regen_btn = self.query_one("#regen-btn", Button)
+        regen_btn = self._regen_btn
         regen_btn.disabled = True
         regen_btn.label = "Regenerating..."
 
@@ -735,11 +1035,10 @@ class UnifiedScreen(Screen):
     def _regenerate_summary(self, title: str) -> None:
         """Regenerate summary (runs in worker thread)."""
         try:
-            summarizer = Summarizer()
+            summarizer = self._get_summarizer()
             output_dir = self.app.config.summaries_dir
 
-            def progress(msg: str) -> None:
-                self.app.call_from_thread(self.notify, msg, severity="information")
+            progress = throttled_progress(self.app, self.notify)
 
             summary_path, generated_title = summarizer.summarize_and_save(
                 self.current_transcript_path,
@@ -754,11 +1053,12 @@ class UnifiedScreen(Screen):
             self.app.db.update_meeting_title(
                 str(self.current_transcript_path), generated_title
             )
+            self._current_summary_path = str(summary_path)
 
             self.app.call_from_thread(
                 self.notify, f"Summary regenerated: {summary_path.name}", severity="information"
             )
-            self.app.call_from_thread(self._refresh_table)
+            self.app.call_from_thread(self._request_refresh)
 
         except Exception as e:
             self.app.call_from_thread(
@@ -766,7 +1066,7 @@ class UnifiedScreen(Screen):
             )
         finally:
             def _restore_btn():
-                regen_btn = self.query_one("#regen-btn", Button)
+                regen_btn = self._regen_btn
                 regen_btn.disabled = False
                 regen_btn.label = "\\[Alt+W] Regenerate"
             self.app.call_from_thread(_restore_btn)
@@ -774,17 +1074,22 @@ class UnifiedScreen(Screen):
     def on_resize(self, event: Resize) -> None:
         """Show warning and hide content when terminal is too small."""
         too_small = event.size.width < 100 or event.size.height < 24
-        self.query_one("#size-warning", Static).display = too_small
-        self.query_one("#unified-container", Container).display = not too_small
+        self._size_warning.display = too_small
+        self._container.display = not too_small
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
         """Update worker status display when workers change state."""
         self._update_worker_display()
+        if not event.worker.is_running and event.worker.name != "refresh":
+            # A transcription/summary just finished; go back to the fast
+            # cadence. The refresh worker itself is excluded: resetting on
+            # its own completion would defeat the idle back-off.
+            self._schedule_refresh(reset=True)
 
     def _update_worker_display(self) -> None:
         """Update the worker status widget with active workers."""
         active = [w for w in self.workers if w.is_running]
-        status_widget = self.query_one("#worker-status", Static)
+        status_widget = self._worker_status
 
         if active:
             descriptions = ", ".join(w.description for w in active)
@@ -796,7 +1101,8 @@ class UnifiedScreen(Screen):
 
     def action_refresh(self) -> None:
         """Refresh the file and transcript list."""
-        self._refresh_table()
+        self._refresh_table(force=True)
+        self._schedule_refresh(reset=True)
         self.notify(f"Found {len(self.items)} item(s)")
 
     def action_go_back(self) -> None:
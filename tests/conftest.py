@@ -0,0 +1,141 @@
+"""Shared fixtures for the test suite."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+# src.app (and with it Textual and every screen module) is imported
+# lazily inside the fixtures so that collection does not pay for it.
+
+
+class FakeConfig:
+    """Plain-attribute stand-in for Config; no mock machinery."""
+
+    def __init__(self, base: Path):
+        self.db_file = base / "test.db"
+        self.watch_dir = base / "watch"
+        self.watch_dir.mkdir()
+        self.raw_transcripts_dir = base / "transcripts"
+        self.summaries_dir = base / "summaries"
+        self.done_dir = base / "done"
+        self.config_file = base / "config.json"
+        self.auto_process = False
+        self.transcribe_concurrency = 3
+
+    def init(self):
+        pass
+
+    def get_api_key(self):
+        return None
+
+
+class FakeDatabase:
+    """In-memory no-op stand-in for Database."""
+
+    def init(self):
+        pass
+
+    def close(self):
+        pass
+
+    def get_pending_count(self):
+        return 0
+
+    def get_unlabeled_count(self):
+        return 0
+
+    def get_pending_audio_files(self):
+        return []
+
+    def list_audio_files(self):
+        return []
+
+    def list_unified(self):
+        return []
+
+    def change_token(self):
+        return (0, 0)
+
+    def audio_exists(self, path):
+        return True
+
+    def add_audio(self, path):
+        return 1
+
+    def add_audio_if_new(self, path):
+        return None
+
+
+class FakeRecorder:
+    """Recorder stand-in that tracks calls with plain counters."""
+
+    def __init__(self):
+        self.is_recording = False
+        self.is_paused = False
+        self.start_calls = 0
+        self.stop_calls = 0
+        self.on_state_change = None
+
+    def start(self, progress_callback=None):
+        self.start_calls += 1
+        self.is_recording = True
+        return Path("/tmp/fake-recording.mp4")
+
+    def stop(self, progress_callback=None):
+        self.stop_calls += 1
+        self.is_recording = False
+        return None
+
+    def get_duration(self):
+        return "00:00:00"
+
+    def get_duration_seconds(self):
+        return 0
+
+
+@pytest.fixture
+def mock_recorder():
+    """Recorder fake shared by the app fixture and assertions."""
+    return FakeRecorder()
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch, mock_recorder):
+    """Create an app with Config, Database, and Recorder faked out.
+
+    Plain stub classes instead of MagicMock: attribute access costs
+    nothing and there is no lazy child-mock creation per lookup.
+    """
+    import src.app
+
+    fake_config = FakeConfig(tmp_path)
+    fake_db = FakeDatabase()
+
+    monkeypatch.setattr(src.app, "Config", lambda *a, **k: fake_config)
+    monkeypatch.setattr(src.app, "Database", lambda *a, **k: fake_db)
+    monkeypatch.setattr(src.app, "Recorder", lambda *a, **k: mock_recorder)
+
+    return src.app.TranscribeApp()
+
+
+@pytest_asyncio.fixture(scope="module")
+async def shared_pilot(tmp_path_factory):
+    """One running app and pilot for a whole test module.
+
+    Textual startup dominates palette tests, so non-destructive tests
+    share a single app and restore the main menu themselves; tests
+    that exit the app build their own via the app fixture.
+    """
+    import src.app
+
+    base = tmp_path_factory.mktemp("shared")
+    with (
+        patch.object(src.app, "Config", lambda *a, **k: FakeConfig(base)),
+        patch.object(src.app, "Database", lambda *a, **k: FakeDatabase()),
+        patch.object(src.app, "Recorder", lambda *a, **k: FakeRecorder()),
+    ):
+        app = src.app.TranscribeApp()
+        async with app.run_test() as pilot:
+            yield app, pilot
@@ -1,114 +1,99 @@
 """Tests for the command palette provider."""
 
-import tempfile
-from pathlib import Path
-from unittest.mock import MagicMock, patch
-
 import pytest
 
-from src.app import TranscribeApp
-from src.commands import TranscribeCommands
-from src.screens.main_menu import MainMenuScreen
-from src.screens.unified import UnifiedScreen
+# src.commands pulls in Textual and both screen modules, so it is
+# imported inside the tests to keep collection light.
+
 
+async def find_command(provider, label):
+    """Return the first discovered hit with the given label.
 
-def _make_app(tmpdir: str) -> TranscribeApp:
-    """Build a TranscribeApp with mocked backends."""
-    mock_config = MagicMock()
-    mock_config.db_file = Path(tmpdir) / "test.db"
-    mock_config.watch_dir = Path(tmpdir) / "watch"
-    mock_config.watch_dir.mkdir(exist_ok=True)
-    mock_config.raw_transcripts_dir = Path(tmpdir) / "transcripts"
-    mock_config.auto_process = False
+    Short-circuits instead of materializing the full discover() stream.
+    """
+    async for hit in provider.discover():
+        if str(hit.display) == label:
+            return hit
+    return None
 
-    mock_db = MagicMock()
-    mock_db.get_pending_count.return_value = 0
-    mock_db.get_unlabeled_count.return_value = 0
-    mock_db.list_unified.return_value = []
-    mock_db.list_audio_files.return_value = []
 
-    mock_recorder = MagicMock()
-    mock_recorder.is_recording = False
+@pytest.fixture(scope="class")
+def provider(shared_pilot):
+    """One provider bound to the shared app's main menu screen."""
+    from src.commands import TranscribeCommands
 
-    with (
-        patch("src.app.Config", return_value=mock_config),
-        patch("src.app.Database", return_value=mock_db),
-        patch("src.app.Recorder", return_value=mock_recorder),
-    ):
-        return TranscribeApp()
+    app, _ = shared_pilot
+    return TranscribeCommands(app.screen)
 
 
 class TestCommandPalette:
     """Tests for TranscribeCommands provider and palette integration."""
 
     @pytest.mark.asyncio
-    async def test_command_palette_opens(self):
+    async def test_command_palette_opens(self, shared_pilot):
         """Ctrl+P opens the command palette overlay."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            app = _make_app(tmpdir)
-            async with app.run_test() as pilot:
-                await pilot.press("ctrl+p")
-                await pilot.pause()
-                from textual.command import CommandPalette
-                assert any(
-                    isinstance(s, CommandPalette) for s in app.screen_stack
-                )
+        app, pilot = shared_pilot
+        await pilot.press("ctrl+p")
+        await pilot.pause()
+        from textual.command import CommandPalette
+        assert any(
+            isinstance(s, CommandPalette) for s in app.screen_stack
+        )
+        # Close the palette so later tests start from the main menu
+        await pilot.press("escape")
+        await pilot.pause()
 
     @pytest.mark.asyncio
-    async def test_discover_commands(self):
+    async def test_discover_commands(self, provider):
         """discover() yields all expected commands."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            app = _make_app(tmpdir)
-            async with app.run_test() as pilot:
-                provider = TranscribeCommands(app.screen)
-                hits = [hit async for hit in provider.discover()]
-                labels = [str(h.display) for h in hits]
-                assert "Files & Labels" in labels
-                assert "Recording" in labels
-                assert "Edit Configuration" in labels
-                assert "Toggle Auto-Process" in labels
-                assert "Process All Pending" in labels
-                assert "Refresh Files" in labels
-                assert "Transcribe Selected" in labels
-                assert "Generate Summary" in labels
-                assert "Regenerate Summary" in labels
-                assert "Save Labels" in labels
-                assert "Open Watch Folder" in labels
-                assert "Quit" in labels
-                assert len(hits) == 12
+        hits = [hit async for hit in provider.discover()]
+        labels = [str(h.display) for h in hits]
+        assert "Files & Labels" in labels
+        assert "Recording" in labels
+        assert "Edit Configuration" in labels
+        assert "Toggle Auto-Process" in labels
+        assert "Process All Pending" in labels
+        assert "Refresh Files" in labels
+        assert "Transcribe Selected" in labels
+        assert "Generate Summary" in labels
+        assert "Regenerate Summary" in labels
+        assert "Save Labels" in labels
+        assert "Open Watch Folder" in labels
+        assert "Quit" in labels
+        assert len(hits) == 12
 
     @pytest.mark.asyncio
-    async def test_search_filters(self):
+    async def test_search_filters(self, provider):
         """search() returns matching commands with scores."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            app = _make_app(tmpdir)
-            async with app.run_test() as pilot:
-                provider = TranscribeCommands(app.screen)
-                hits = [hit async for hit in provider.search("record")]
-                texts = [h.help for h in hits]
-                assert any("recording" in t.lower() for t in texts)
-                assert all(h.score > 0 for h in hits)
+        hits = [hit async for hit in provider.search("record")]
+        texts = [h.help for h in hits]
+        assert any("recording" in t.lower() for t in texts)
+        assert all(h.score > 0 for h in hits)
 
     @pytest.mark.asyncio
-    async def test_command_navigates_to_files(self):
+    async def test_command_navigates_to_files(self, shared_pilot, provider):
         """Invoking 'Files & Labels' command navigates to UnifiedScreen."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            app = _make_app(tmpdir)
-            async with app.run_test() as pilot:
-                provider = TranscribeCommands(app.screen)
-                hits = [hit async for hit in provider.discover()]
-                files_hit = [h for h in hits if str(h.display) == "Files & Labels"][0]
-                await files_hit.command()
-                await pilot.pause()
-                assert isinstance(app.screen, UnifiedScreen)
+        from src.screens.main_menu import MainMenuScreen
+        from src.screens.unified import UnifiedScreen
+
+        app, pilot = shared_pilot
+        files_hit = await find_command(provider, "Files & Labels")
+        assert files_hit is not None
+        await files_hit.command()
+        await pilot.pause()
+        assert isinstance(app.screen, UnifiedScreen)
+        # Return to the main menu for any later shared-app test
+        await pilot.press("escape")
+        await pilot.pause()
+        assert isinstance(app.screen, MainMenuScreen)
 
     @pytest.mark.asyncio
-    async def test_command_quit(self):
+    async def test_command_quit(self, app):
         """Invoking 'Quit' command exits the app."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            app = _make_app(tmpdir)
-            async with app.run_test() as pilot:
-                provider = TranscribeCommands(app.screen)
-                hits = [hit async for hit in provider.discover()]
-                quit_hit = [h for h in hits if str(h.display) == "Quit"][0]
-                await quit_hit.command()
+        from src.commands import TranscribeCommands
+
+        async with app.run_test() as pilot:
+            provider = TranscribeCommands(app.screen)
+            quit_hit = await find_command(provider, "Quit")
+            assert quit_hit is not None
+            await quit_hit.command()
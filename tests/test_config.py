@@ -1,7 +1,7 @@
 """Tests for configuration management."""
 
-import json
-import tempfile
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -9,6 +9,14 @@ import pytest
 from src.core.config import Config
 
 
+@pytest.fixture
+def initialized_config(tmp_path):
+    """A Config backed by a fresh tmp_path with init() already run."""
+    config = Config(config_dir=tmp_path)
+    config.init()
+    return config
+
+
 class TestConfig:
     """Tests for the Config class."""
 
@@ -26,94 +34,87 @@ class TestConfig:
         expanded = Config.expand_path(path)
         assert expanded == path
 
-    def test_default_values(self):
-        """Test that default values are returned when config file missing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = Config(config_dir=tmpdir)
-
-            # Should return expanded default values
-            assert config.get("auto_process") is True
-            assert "watch_dir" in config.DEFAULT_CONFIG
+    def test_default_values(self, initialized_config):
+        """Test that default values are returned out of the box."""
+        assert initialized_config.get("auto_process") is True
+        assert "watch_dir" in initialized_config.DEFAULT_CONFIG
 
-    def test_config_init_creates_file(self):
+    def test_config_init_creates_file(self, initialized_config):
         """Test that init() creates config file with defaults."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = Config(config_dir=tmpdir)
-            config.init()
+        import json
 
-            assert config.config_file.exists()
+        assert initialized_config.config_file.exists()
 
-            with open(config.config_file) as f:
-                data = json.load(f)
-            assert "watch_dir" in data
+        with open(initialized_config.config_file) as f:
+            data = json.load(f)
+        assert "watch_dir" in data
 
-    def test_get_set_config(self):
+    def test_get_set_config(self, initialized_config):
         """Test getting and setting config values."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = Config(config_dir=tmpdir)
-            config.init()
+        initialized_config.set("auto_process", False)
+        assert initialized_config.get("auto_process") is False
 
-            config.set("auto_process", False)
-            assert config.get("auto_process") is False
+        initialized_config.set("custom_key", "custom_value")
+        assert initialized_config.get("custom_key") == "custom_value"
 
-            config.set("custom_key", "custom_value")
-            assert config.get("custom_key") == "custom_value"
-
-    def test_get_all_config(self):
+    def test_get_all_config(self, initialized_config):
         """Test getting all configuration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = Config(config_dir=tmpdir)
-            config.init()
-
-            all_config = config.get_all()
-            assert isinstance(all_config, dict)
-            assert "watch_dir" in all_config
+        all_config = initialized_config.get_all()
+        assert isinstance(all_config, dict)
+        assert "watch_dir" in all_config
 
-    def test_get_missing_key_returns_default(self):
+    def test_get_missing_key_returns_default(self, tmp_path):
         """Test that missing keys return provided default."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = Config(config_dir=tmpdir)
+        config = Config(config_dir=tmp_path)
 
-            result = config.get("nonexistent_key", "default_value")
-            assert result == "default_value"
+        result = config.get("nonexistent_key", "default_value")
+        assert result == "default_value"
 
-    def test_path_properties(self):
+    def test_path_properties(self, initialized_config):
         """Test path property accessors."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = Config(config_dir=tmpdir)
-            config.init()
-
-            assert isinstance(config.watch_dir, Path)
-            assert isinstance(config.raw_transcripts_dir, Path)
-            assert isinstance(config.summaries_dir, Path)
-            assert isinstance(config.done_dir, Path)
+        assert isinstance(initialized_config.watch_dir, Path)
+        assert isinstance(initialized_config.raw_transcripts_dir, Path)
+        assert isinstance(initialized_config.summaries_dir, Path)
+        assert isinstance(initialized_config.done_dir, Path)
 
-    def test_get_api_key_missing_file(self):
+    def test_get_api_key_missing_file(self, tmp_path):
         """Test get_api_key returns None when file missing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = Config(config_dir=tmpdir)
-            config.set("api_key_file", f"{tmpdir}/nonexistent.json")
+        config = Config(config_dir=tmp_path)
+        config.set("api_key_file", str(tmp_path / "nonexistent.json"))
 
-            assert config.get_api_key() is None
+        assert config.get_api_key() is None
 
-    def test_get_api_key_from_file(self):
+    def test_get_api_key_from_file(self, tmp_path):
         """Test get_api_key reads from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            api_key_file = Path(tmpdir) / "apikey.json"
-            api_key_file.write_text('{"assemblyai_api_key": "test-key-123"}')
+        api_key_file = tmp_path / "apikey.json"
+        api_key_file.write_text('{"assemblyai_api_key": "test-key-123"}')
 
-            config = Config(config_dir=tmpdir)
-            config.set("api_key_file", str(api_key_file))
+        config = Config(config_dir=tmp_path)
+        config.set("api_key_file", str(api_key_file))
 
-            assert config.get_api_key() == "test-key-123"
+        assert config.get_api_key() == "test-key-123"
 
-    def test_auto_process_property(self):
-        """Test auto_process boolean property."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = Config(config_dir=tmpdir)
-            config.init()
+    def test_get_api_key_cached_until_file_changes(self, tmp_path):
+        """Test get_api_key caches the key until the file changes."""
+        api_key_file = tmp_path / "apikey.json"
+        api_key_file.write_text('{"assemblyai_api_key": "old-key"}')
+
+        config = Config(config_dir=tmp_path)
+        config.set("api_key_file", str(api_key_file))
+
+        assert config.get_api_key() == "old-key"
+        assert config.get_api_key() == "old-key"
 
-            assert config.auto_process is True
+        # Rewrite the file with a bumped mtime to invalidate the cache
+        api_key_file.write_text('{"assemblyai_api_key": "new-key"}')
+        future = time.time() + 10
+        os.utime(api_key_file, (future, future))
+
+        assert config.get_api_key() == "new-key"
+
+    def test_auto_process_property(self, initialized_config):
+        """Test auto_process boolean property."""
+        assert initialized_config.auto_process is True
 
-            config.set("auto_process", False)
-            assert config.auto_process is False
+        initialized_config.set("auto_process", False)
+        assert initialized_config.auto_process is False
@@ -1,26 +1,28 @@
 """Tests for database operations."""
 
-import tempfile
-from datetime import datetime
-from pathlib import Path
-
 import pytest
 
 from src.core.database import Database
 
 
+@pytest.fixture(scope="class")
+def db():
+    """One in-memory database for the whole class; DDL runs once."""
+    database = Database(":memory:")
+    database.configure_for_tests()
+    database.init()
+    yield database
+    database.close()
+
+
 class TestDatabase:
     """Tests for the Database class."""
 
-    @pytest.fixture
-    def db(self):
-        """Create a temporary database for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            db_path = Path(tmpdir) / "test.db"
-            database = Database(db_path)
-            database.init()
-            yield database
-            database.close()
+    @pytest.fixture(autouse=True)
+    def _clean_db(self, db):
+        """Clear all rows after each test so tests stay isolated."""
+        yield
+        db.reset_tables()
 
     def test_init_creates_tables(self, db):
         """Test that init creates required tables."""
@@ -54,6 +56,15 @@ class TestDatabase:
 
         assert id1 == id2
 
+    def test_add_audio_if_new(self, db):
+        """Test that add_audio_if_new only reports genuinely new files."""
+        path = "/test/audio.mp4"
+        audio_id = db.add_audio_if_new(path)
+
+        assert audio_id is not None
+        assert db.add_audio_if_new(path) is None
+        assert db.get_audio_id(path) == audio_id
+
     def test_get_audio_id(self, db):
         """Test getting audio ID by path."""
         path = "/test/audio.mp4"
@@ -76,6 +87,29 @@ class TestDatabase:
         db.mark_transcribed(audio_path, transcript_path)
         assert db.is_transcribed(audio_path)
 
+    def test_bulk_mark_transcribed(self, db):
+        """Test marking several audio files transcribed in one call."""
+        db.add_many_audio(["/test/audio1.mp4", "/test/audio2.mp4"])
+
+        db.bulk_mark_transcribed(
+            [
+                ("/test/audio1.mp4", "/test/transcript1.yaml"),
+                ("/test/audio2.mp4", "/test/transcript2.yaml"),
+            ]
+        )
+
+        assert db.is_transcribed("/test/audio1.mp4")
+        assert db.is_transcribed("/test/audio2.mp4")
+
+        unlabeled = db.get_unlabeled()
+        assert "/test/transcript1.yaml" in unlabeled
+        assert "/test/transcript2.yaml" in unlabeled
+
+    def test_bulk_mark_transcribed_empty(self, db):
+        """Test that an empty batch is a no-op."""
+        db.bulk_mark_transcribed([])
+        assert db.get_pending_count() == 0
+
     def test_delete_audio(self, db):
         """Test deleting audio file record."""
         path = "/test/audio.mp4"
@@ -87,8 +121,7 @@ class TestDatabase:
 
     def test_list_audio_files(self, db):
         """Test listing audio files."""
-        db.add_audio("/test/audio1.mp4")
-        db.add_audio("/test/audio2.mp4")
+        db.add_many_audio(["/test/audio1.mp4", "/test/audio2.mp4"])
 
         files = db.list_audio_files()
         assert len(files) == 2
@@ -192,41 +225,64 @@ class TestDatabase:
         transcripts = db.list_transcripts()
         assert len(transcripts) == 2
 
-    def test_get_pending_count(self, db):
-        """Test getting pending file count."""
-        assert db.get_pending_count() == 0
-
-        db.add_audio("/test/audio1.mp4")
-        db.add_audio("/test/audio2.mp4")
-
-        assert db.get_pending_count() == 2
-
-        db.mark_transcribed("/test/audio1.mp4", "/test/transcript.yaml")
-
-        assert db.get_pending_count() == 1
-
-    def test_get_unlabeled_count(self, db):
-        """Test getting unlabeled count."""
-        assert db.get_unlabeled_count() == 0
-
-        db.add_transcript("/test/transcript1.yaml")
-        db.add_transcript("/test/transcript2.yaml")
-
-        assert db.get_unlabeled_count() == 2
-
-        db.mark_labeled("/test/transcript1.yaml")
-
-        assert db.get_unlabeled_count() == 1
-
-    def test_get_unsummarized_count(self, db):
-        """Test getting unsummarized count."""
-        assert db.get_unsummarized_count() == 0
-
-        db.add_transcript("/test/transcript1.yaml")
-        db.mark_labeled("/test/transcript1.yaml")
-
-        assert db.get_unsummarized_count() == 1
-
-        db.mark_summarized("/test/transcript1.yaml", "/test/summary.md")
-
-        assert db.get_unsummarized_count() == 0
+    @pytest.mark.parametrize(
+        ("populate", "counter", "advance", "expected"),
+        [
+            pytest.param(
+                lambda db: db.add_many_audio(
+                    ["/test/audio1.mp4", "/test/audio2.mp4"]
+                ),
+                "get_pending_count",
+                lambda db: db.mark_transcribed(
+                    "/test/audio1.mp4", "/test/transcript.yaml"
+                ),
+                2,
+                id="pending",
+            ),
+            pytest.param(
+                lambda db: [
+                    db.add_transcript("/test/transcript1.yaml"),
+                    db.add_transcript("/test/transcript2.yaml"),
+                ],
+                "get_unlabeled_count",
+                lambda db: db.mark_labeled("/test/transcript1.yaml"),
+                2,
+                id="unlabeled",
+            ),
+            pytest.param(
+                lambda db: [
+                    db.add_transcript("/test/transcript1.yaml"),
+                    db.mark_labeled("/test/transcript1.yaml"),
+                ],
+                "get_unsummarized_count",
+                lambda db: db.mark_summarized(
+                    "/test/transcript1.yaml", "/test/summary.md"
+                ),
+                1,
+                id="unsummarized",
+            ),
+        ],
+    )
+    def test_counts(self, db, populate, counter, advance, expected):
+        """Test that each count tracks its add -> mark state transition."""
+        count = getattr(db, counter)
+
+        assert count() == 0
+
+        populate(db)
+        assert count() == expected
+
+        advance(db)
+        assert count() == expected - 1
+
+    def test_change_token(self, db):
+        """Test that the change token moves on writes and is stable on reads."""
+        token = db.change_token()
+        assert db.change_token() == token
+
+        db.add_audio("/test/audio.mp4")
+        new_token = db.change_token()
+        assert new_token != token
+
+        db.list_audio_files()
+        assert db.change_token() == new_token
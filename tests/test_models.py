@@ -1,56 +1,79 @@
 """Tests for data models."""
 
-import tempfile
+import copy
 from datetime import datetime
-from pathlib import Path
 
 import pytest
 
 from src.models import AudioFile, Speaker, Transcript, TranscriptData, Utterance
 
+# Fixed timestamp for status tests; keeps cases deterministic and
+# avoids a clock read per test.
+SENTINEL_DT = datetime(2025, 1, 1)
+
+
+@pytest.fixture(scope="session")
+def sample_transcript_template():
+    """A sample transcript built once per session; treat as read-only."""
+    return TranscriptData(
+        source_file="test.mp4",
+        transcribed=datetime(2025, 1, 15, 10, 30),
+        duration_seconds=120,
+        labeled=False,
+        speakers=[
+            Speaker(id="A", name=None),
+            Speaker(id="B", name=None),
+        ],
+        utterances=[
+            Utterance(speaker="A", start=0.0, end=2.5, text="Hello everyone"),
+            Utterance(speaker="B", start=2.5, end=5.0, text="Hi there"),
+            Utterance(speaker="A", start=5.0, end=8.0, text="Let's get started"),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_yaml_str(sample_transcript_template):
+    """The template serialized once; to_yaml is pure."""
+    return sample_transcript_template.to_yaml()
+
 
 class TestAudioFile:
     """Tests for AudioFile model."""
 
-    def test_status_pending(self):
-        """Test that status is pending when not transcribed."""
-        audio = AudioFile(path="/test/audio.mp4", filename="audio.mp4")
-        assert audio.status == "pending"
-
-    def test_status_transcribed(self):
-        """Test that status is transcribed when transcribed_at is set."""
-        audio = AudioFile(
-            path="/test/audio.mp4",
-            filename="audio.mp4",
-            transcribed_at=datetime.now(),
-        )
-        assert audio.status == "transcribed"
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, "pending"),
+            ({"transcribed_at": SENTINEL_DT}, "transcribed"),
+        ],
+        ids=["pending", "transcribed"],
+    )
+    def test_status(self, kwargs, expected):
+        """Test that status reflects the transcription timestamp."""
+        audio = AudioFile(path="/test/audio.mp4", filename="audio.mp4", **kwargs)
+        assert audio.status == expected
 
 
 class TestTranscript:
     """Tests for Transcript model."""
 
-    def test_status_unlabeled(self):
-        """Test status when unlabeled."""
-        transcript = Transcript(path="/test/transcript.yaml")
-        assert transcript.status == "unlabeled"
-
-    def test_status_labeled(self):
-        """Test status when labeled."""
-        transcript = Transcript(
-            path="/test/transcript.yaml",
-            labeled_at=datetime.now(),
-        )
-        assert transcript.status == "labeled"
-
-    def test_status_summarized(self):
-        """Test status when summarized."""
-        transcript = Transcript(
-            path="/test/transcript.yaml",
-            labeled_at=datetime.now(),
-            summarized_at=datetime.now(),
-        )
-        assert transcript.status == "summarized"
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({}, "unlabeled"),
+            ({"labeled_at": SENTINEL_DT}, "labeled"),
+            (
+                {"labeled_at": SENTINEL_DT, "summarized_at": SENTINEL_DT},
+                "summarized",
+            ),
+        ],
+        ids=["unlabeled", "labeled", "summarized"],
+    )
+    def test_status(self, kwargs, expected):
+        """Test that status reflects the labeling/summary timestamps."""
+        transcript = Transcript(path="/test/transcript.yaml", **kwargs)
+        assert transcript.status == expected
 
 
 class TestSpeaker:
@@ -104,23 +127,9 @@ class TestTranscriptData:
     """Tests for TranscriptData model."""
 
     @pytest.fixture
-    def sample_transcript(self):
-        """Create a sample transcript for testing."""
-        return TranscriptData(
-            source_file="test.mp4",
-            transcribed=datetime(2025, 1, 15, 10, 30),
-            duration_seconds=120,
-            labeled=False,
-            speakers=[
-                Speaker(id="A", name=None),
-                Speaker(id="B", name=None),
-            ],
-            utterances=[
-                Utterance(speaker="A", start=0.0, end=2.5, text="Hello everyone"),
-                Utterance(speaker="B", start=2.5, end=5.0, text="Hi there"),
-                Utterance(speaker="A", start=5.0, end=8.0, text="Let's get started"),
-            ],
-        )
+    def sample_transcript(self, sample_transcript_template):
+        """A private copy of the template; tests may mutate it freely."""
+        return copy.deepcopy(sample_transcript_template)
 
     def test_get_speaker_samples(self, sample_transcript):
         """Test getting sample utterances for a speaker."""
@@ -177,44 +186,38 @@ class TestTranscriptData:
         assert "Alice" in participants
         assert "Bob" in participants
 
-    def test_to_yaml(self, sample_transcript):
+    def test_to_yaml(self, sample_yaml_str):
         """Test YAML serialization."""
-        yaml_str = sample_transcript.to_yaml()
+        assert "source_file: test.mp4" in sample_yaml_str
+        assert "duration_seconds: 120" in sample_yaml_str
+        assert "labeled: false" in sample_yaml_str
+        assert 'id: "A"' in sample_yaml_str
+        assert 'text: "Hello everyone"' in sample_yaml_str
 
-        assert "source_file: test.mp4" in yaml_str
-        assert "duration_seconds: 120" in yaml_str
-        assert "labeled: false" in yaml_str
-        assert 'id: "A"' in yaml_str
-        assert 'text: "Hello everyone"' in yaml_str
-
-    def test_yaml_roundtrip(self, sample_transcript):
+    def test_yaml_roundtrip(self, sample_transcript_template, sample_yaml_str):
         """Test YAML serialization and deserialization."""
-        yaml_str = sample_transcript.to_yaml()
-        loaded = TranscriptData.from_yaml(yaml_str)
+        loaded = TranscriptData.from_yaml(sample_yaml_str)
 
-        assert loaded.source_file == sample_transcript.source_file
-        assert loaded.duration_seconds == sample_transcript.duration_seconds
-        assert loaded.labeled == sample_transcript.labeled
-        assert len(loaded.speakers) == len(sample_transcript.speakers)
-        assert len(loaded.utterances) == len(sample_transcript.utterances)
+        assert loaded.source_file == sample_transcript_template.source_file
+        assert loaded.duration_seconds == sample_transcript_template.duration_seconds
+        assert loaded.labeled == sample_transcript_template.labeled
+        assert len(loaded.speakers) == len(sample_transcript_template.speakers)
+        assert len(loaded.utterances) == len(sample_transcript_template.utterances)
 
-    def test_save_and_load(self, sample_transcript):
+    def test_save_and_load(self, sample_transcript_template, sample_yaml_str, tmp_path):
         """Test saving and loading from file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "transcript.yaml"
-
-            sample_transcript.save(path)
-            assert path.exists()
+        path = tmp_path / "transcript.yaml"
+        path.write_text(sample_yaml_str)
 
-            loaded = TranscriptData.load(path)
-            assert loaded.source_file == sample_transcript.source_file
-            assert len(loaded.utterances) == len(sample_transcript.utterances)
+        loaded = TranscriptData.load(path)
+        assert loaded.source_file == sample_transcript_template.source_file
+        assert len(loaded.utterances) == len(sample_transcript_template.utterances)
 
     def test_yaml_with_quotes_in_text(self):
         """Test YAML handles quotes in text properly."""
         transcript = TranscriptData(
             source_file="test.mp4",
-            transcribed=datetime.now(),
+            transcribed=SENTINEL_DT,
             duration_seconds=10,
             labeled=False,
             speakers=[Speaker(id="A")],
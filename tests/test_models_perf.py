@@ -0,0 +1,48 @@
+"""Performance regression guard for TranscriptData YAML round-trips."""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from src.models import Speaker, TranscriptData, Utterance
+
+try:
+    from yaml import CSafeLoader  # noqa: F401
+
+    HAVE_LIBYAML = True
+except ImportError:
+    HAVE_LIBYAML = False
+
+
+@pytest.mark.skipif(not HAVE_LIBYAML, reason="libyaml extension not installed")
+def test_roundtrip_speed():
+    """A 1000-utterance transcript should round-trip well under 200ms.
+
+    Guards the libyaml loader switch: a silent fall-back to the pure
+    Python parser is roughly an order of magnitude slower.
+    """
+    transcript = TranscriptData(
+        source_file="perf.mp4",
+        transcribed=datetime(2025, 1, 15, 10, 30),
+        duration_seconds=3600,
+        labeled=False,
+        speakers=[Speaker(id="A"), Speaker(id="B")],
+        utterances=[
+            Utterance(
+                speaker="AB"[i % 2],
+                start=i * 3.0,
+                end=i * 3.0 + 2.5,
+                text=f"Utterance number {i} with a reasonable amount of text.",
+            )
+            for i in range(1000)
+        ],
+    )
+
+    start = time.perf_counter()
+    yaml_str = transcript.to_yaml()
+    loaded = TranscriptData.from_yaml(yaml_str)
+    elapsed = time.perf_counter() - start
+
+    assert len(loaded.utterances) == 1000
+    assert elapsed < 0.2
@@ -1,8 +1,5 @@
 """Tests for the transcriber module."""
 
-import tempfile
-from datetime import datetime
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,46 +7,74 @@ import pytest
 from src.core.transcriber import TranscriptionError, Transcriber
 
 
-class TestTranscriber:
-    """Tests for the Transcriber class."""
+# Static mock AssemblyAI response; no test mutates it, so a plain
+# module-level constant beats fixture dispatch.
+MOCK_ASSEMBLYAI_RESPONSE = {
+    "id": "test-transcript-id",
+    "status": "completed",
+    "audio_duration": 120,
+    "utterances": [
+        {
+            "speaker": "A",
+            "start": 0,
+            "end": 2500,
+            "text": "Hello everyone, welcome to the meeting.",
+        },
+        {
+            "speaker": "B",
+            "start": 2500,
+            "end": 5000,
+            "text": "Thanks for having me.",
+        },
+        {
+            "speaker": "A",
+            "start": 5000,
+            "end": 8000,
+            "text": "Let's discuss the project updates.",
+        },
+    ],
+}
+
+
+def make_mock_session(status_code, json_payload=None, text=None, method="post"):
+    """Build a mock session whose given method returns one canned response."""
+    session = MagicMock()
+    response = MagicMock()
+    response.status_code = status_code
+    if json_payload is not None:
+        response.json.return_value = json_payload
+    if text is not None:
+        response.text = text
+    getattr(session, method).return_value = response
+    return session, response
+
+
+@pytest.fixture(scope="session")
+def dummy_audio_path(tmp_path_factory):
+    """A tiny audio file on disk, written once for the whole session."""
+    path = tmp_path_factory.mktemp("audio") / "test.mp4"
+    path.write_bytes(b"test audio content")
+    return path
+
+
+@pytest.fixture(scope="class")
+def transcriber():
+    """One transcriber per class; session adapter setup is amortized.
+
+    Tests that talk to the API replace .session with their own mock,
+    so sharing the instance is safe.
+    """
+    return Transcriber("test-api-key")
 
-    @pytest.fixture
-    def transcriber(self):
-        """Create a transcriber with a test API key."""
-        return Transcriber("test-api-key")
 
-    @pytest.fixture
-    def mock_response(self):
-        """Create a mock AssemblyAI response."""
-        return {
-            "id": "test-transcript-id",
-            "status": "completed",
-            "audio_duration": 120,
-            "utterances": [
-                {
-                    "speaker": "A",
-                    "start": 0,
-                    "end": 2500,
-                    "text": "Hello everyone, welcome to the meeting.",
-                },
-                {
-                    "speaker": "B",
-                    "start": 2500,
-                    "end": 5000,
-                    "text": "Thanks for having me.",
-                },
-                {
-                    "speaker": "A",
-                    "start": 5000,
-                    "end": 8000,
-                    "text": "Let's discuss the project updates.",
-                },
-            ],
-        }
+class TestTranscriber:
+    """Tests for the Transcriber class."""
 
-    def test_convert_to_transcript_data(self, transcriber, mock_response):
+    def test_convert_to_transcript_data(self, transcriber):
         """Test converting AssemblyAI response to TranscriptData."""
-        transcript = transcriber.convert_to_transcript_data(mock_response, "/test/audio.mp4")
+        transcript = transcriber.convert_to_transcript_data(
+            MOCK_ASSEMBLYAI_RESPONSE, "/test/audio.mp4"
+        )
 
         assert transcript.source_file == "audio.mp4"
         assert transcript.duration_seconds == 120
@@ -80,92 +105,60 @@ class TestTranscriber:
         assert len(transcript.speakers) == 0
         assert len(transcript.utterances) == 0
 
-    @patch("src.core.transcriber.requests.Session")
-    def test_upload_success(self, mock_session_class, transcriber):
-        """Test successful file upload."""
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"upload_url": "https://example.com/upload"}
-        mock_session.post.return_value = mock_response
+    @pytest.mark.parametrize(
+        ("status_code", "ok"),
+        [(200, True), (400, False)],
+        ids=["success", "failure"],
+    )
+    def test_upload(self, transcriber, dummy_audio_path, status_code, ok):
+        """Test upload success and failure handling."""
+        mock_session, _ = make_mock_session(
+            status_code,
+            json_payload={"upload_url": "https://example.com/upload"},
+            text="Bad request",
+        )
         transcriber.session = mock_session
 
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as f:
-            f.write(b"test audio content")
-            f.flush()
-
-            url = transcriber.upload(f.name)
-
+        if ok:
+            url = transcriber.upload(str(dummy_audio_path))
             assert url == "https://example.com/upload"
-            mock_session.post.assert_called_once()
-
-    @patch("src.core.transcriber.requests.Session")
-    def test_upload_failure(self, mock_session_class, transcriber):
-        """Test upload failure handling."""
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad request"
-        mock_session.post.return_value = mock_response
-        transcriber.session = mock_session
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4") as f:
-            f.write(b"test")
-            f.flush()
-
+            assert mock_session.post.call_count == 1
+        else:
             with pytest.raises(TranscriptionError) as exc:
-                transcriber.upload(f.name)
-
+                transcriber.upload(str(dummy_audio_path))
             assert "Upload failed" in str(exc.value)
 
-    @patch("src.core.transcriber.requests.Session")
-    def test_start_transcription_success(self, mock_session_class, transcriber):
+    def test_start_transcription_success(self, transcriber):
         """Test starting transcription."""
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "test-id-123"}
-        mock_session.post.return_value = mock_response
+        mock_session, _ = make_mock_session(200, json_payload={"id": "test-id-123"})
         transcriber.session = mock_session
 
         transcript_id = transcriber.start_transcription("https://example.com/audio")
 
         assert transcript_id == "test-id-123"
-        mock_session.post.assert_called_once()
-
-    @patch("src.core.transcriber.requests.Session")
-    @patch("src.core.transcriber.time.sleep")
-    def test_poll_transcription_completed(
-        self, mock_sleep, mock_session_class, transcriber, mock_response
-    ):
-        """Test polling for completed transcription."""
-        mock_session = MagicMock()
-        mock_api_response = MagicMock()
-        mock_api_response.status_code = 200
-        mock_api_response.json.return_value = mock_response
-        mock_session.get.return_value = mock_api_response
+        assert mock_session.post.call_count == 1
+
+    @pytest.mark.parametrize(
+        ("payload", "error"),
+        [
+            (MOCK_ASSEMBLYAI_RESPONSE, None),
+            ({"status": "error", "error": "Audio too short"}, "Audio too short"),
+        ],
+        ids=["completed", "error"],
+    )
+    def test_poll_transcription(self, transcriber, payload, error):
+        """Test polling for completed and errored transcriptions."""
+        mock_session, _ = make_mock_session(200, json_payload=payload, method="get")
         transcriber.session = mock_session
 
-        result = transcriber.poll_transcription("test-id")
-
-        assert result["status"] == "completed"
-        assert result["audio_duration"] == 120
-
-    @patch("src.core.transcriber.requests.Session")
-    @patch("src.core.transcriber.time.sleep")
-    def test_poll_transcription_error(self, mock_sleep, mock_session_class, transcriber):
-        """Test polling handles transcription error."""
-        mock_session = MagicMock()
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"status": "error", "error": "Audio too short"}
-        mock_session.get.return_value = mock_response
-        transcriber.session = mock_session
-
-        with pytest.raises(TranscriptionError) as exc:
-            transcriber.poll_transcription("test-id")
-
-        assert "Audio too short" in str(exc.value)
+        if error is None:
+            result = transcriber.poll_transcription("test-id", poll_interval=0)
+            assert result["status"] == "completed"
+            assert result["audio_duration"] == 120
+        else:
+            with pytest.raises(TranscriptionError) as exc:
+                transcriber.poll_transcription("test-id", poll_interval=0)
+            assert error in str(exc.value)
 
     def test_transcribe_file_not_found(self, transcriber):
         """Test transcribe raises error for missing file."""
@@ -183,45 +176,36 @@ class TestTranscriber:
         mock_start,
         mock_upload,
         transcriber,
-        mock_response,
+        dummy_audio_path,
     ):
         """Test full transcription flow."""
         mock_upload.return_value = "https://example.com/upload"
         mock_start.return_value = "test-id"
-        mock_poll.return_value = mock_response
-
-        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
-            f.write(b"test audio content")
-            f.flush()
+        mock_poll.return_value = MOCK_ASSEMBLYAI_RESPONSE
 
-            transcript = transcriber.transcribe(f.name)
+        transcript = transcriber.transcribe(str(dummy_audio_path))
 
-            assert transcript.source_file == Path(f.name).name
-            assert transcript.duration_seconds == 120
-            assert len(transcript.speakers) == 2
-            assert len(transcript.utterances) == 3
-
-            Path(f.name).unlink()
+        assert transcript.source_file == dummy_audio_path.name
+        assert transcript.duration_seconds == 120
+        assert len(transcript.speakers) == 2
+        assert len(transcript.utterances) == 3
 
     @patch.object(Transcriber, "transcribe")
-    def test_transcribe_and_save(self, mock_transcribe, transcriber, mock_response):
+    def test_transcribe_and_save(
+        self, mock_transcribe, transcriber, dummy_audio_path, tmp_path
+    ):
         """Test transcribe and save to file."""
-        transcript = transcriber.convert_to_transcript_data(mock_response, "/test/audio.mp4")
+        transcript = transcriber.convert_to_transcript_data(
+            MOCK_ASSEMBLYAI_RESPONSE, "/test/audio.mp4"
+        )
         mock_transcribe.return_value = transcript
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as f:
-                f.write(b"test")
-                f.flush()
-
-                output_path = transcriber.transcribe_and_save(f.name, tmpdir)
-
-                assert output_path.exists()
-                assert output_path.suffix == ".yaml"
-                assert "transcript" in output_path.name
+        output_path = transcriber.transcribe_and_save(str(dummy_audio_path), tmp_path)
 
-                content = output_path.read_text()
-                assert "source_file:" in content
-                assert "utterances:" in content
+        assert output_path.exists()
+        assert output_path.suffix == ".yaml"
+        assert "transcript" in output_path.name
 
-                Path(f.name).unlink()
+        content = output_path.read_text()
+        assert "source_file:" in content
+        assert "utterances:" in content
@@ -8,76 +8,136 @@ Tests the complete pipeline:
 5. Summarization (mocked)
 """
 
-import tempfile
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import pytest
+import yaml
 
-from src.core.config import Config
 from src.core.database import Database
 from src.core.transcriber import Transcriber
-from src.models import Speaker, TranscriptData, Utterance
+from src.models import Speaker, TranscriptData, Utterance, _YamlLoader
+
+AUDIO_EXTS = frozenset({".mp4", ".m4a", ".mp3", ".wav", ".ogg", ".webm", ".flac"})
+
+# Fixed timestamp for generated transcripts: no clock read per transcript,
+# and deterministic YAML output.
+_FIXED_NOW = datetime(2026, 1, 30, 12, 0, 0)
+
+
+def _write_all(pairs):
+    """Write several independent files concurrently to overlap I/O latency."""
+
+    def _write(pair):
+        path, data = pair
+        if isinstance(data, bytes):
+            path.write_bytes(data)
+        else:
+            path.write_text(data)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_write, pairs))
+
+
+def _iter_audio(watch_dir):
+    """Yield audio file paths in watch_dir without per-entry stat calls."""
+    with os.scandir(watch_dir) as entries:
+        for entry in entries:
+            if (
+                entry.is_file(follow_symlinks=False)
+                and os.path.splitext(entry.name)[1].lower() in AUDIO_EXTS
+            ):
+                yield entry.path
+
+
+@pytest.fixture
+def temp_dirs(tmp_path_factory):
+    """Directory skeleton for one test under the shared session root.
+
+    tmp_path_factory reuses one session-scoped base directory and
+    cleans up lazily, unlike a per-test TemporaryDirectory + rmtree.
+    """
+    base = tmp_path_factory.mktemp("workflow")
+    dirs = {
+        "base": base,
+        "watch": base / "watch",
+        "raw_transcripts": base / "raw-transcription",
+        "done": base / "done",
+        "summaries": base / "summaries",
+    }
+    for key, path in dirs.items():
+        if key != "base":
+            path.mkdir()
+    return dirs
+
+
+@pytest.fixture(scope="session")
+def mock_assemblyai_response():
+    """Mock AssemblyAI transcription response; no test mutates it."""
+    return {
+        "id": "test-transcript-id",
+        "status": "completed",
+        "audio_duration": 120,
+        "utterances": [
+            {
+                "speaker": "A",
+                "start": 0,
+                "end": 5000,
+                "text": "Hello, this is speaker A talking.",
+            },
+            {
+                "speaker": "B",
+                "start": 5000,
+                "end": 10000,
+                "text": "Hi, this is speaker B responding.",
+            },
+        ],
+    }
+
+
+@pytest.fixture(scope="class")
+def db():
+    """One in-memory database per class; rows are cleared between tests."""
+    database = Database(":memory:")
+    database.configure_for_tests()
+    database.init()
+    yield database
+    database.close()
+
+
+@pytest.fixture(scope="session")
+def mock_transcript_template(mock_assemblyai_response):
+    """The converted TranscriptData, built once; tests deepcopy it."""
+    return Transcriber("test-api-key").convert_to_transcript_data(
+        mock_assemblyai_response, "template.mp4"
+    )
 
 
 class TestWorkflow:
     """Integration tests for the transcription workflow."""
 
-    @pytest.fixture
-    def temp_dirs(self):
-        """Create temporary directories for testing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir = Path(tmpdir)
-            watch_dir = tmpdir / "watch"
-            raw_transcripts_dir = tmpdir / "raw-transcription"
-            done_dir = tmpdir / "done"
-            summaries_dir = tmpdir / "summaries"
-
-            watch_dir.mkdir()
-            raw_transcripts_dir.mkdir()
-            done_dir.mkdir()
-            summaries_dir.mkdir()
-
-            yield {
-                "base": tmpdir,
-                "watch": watch_dir,
-                "raw_transcripts": raw_transcripts_dir,
-                "done": done_dir,
-                "summaries": summaries_dir,
-            }
-
-    @pytest.fixture
-    def db(self, temp_dirs):
-        """Create a temporary database."""
-        db_path = temp_dirs["base"] / "test.db"
-        database = Database(db_path)
-        database.init()
-        yield database
-        database.close()
-
-    @pytest.fixture
-    def mock_assemblyai_response(self):
-        """Mock AssemblyAI transcription response."""
-        return {
-            "id": "test-transcript-id",
-            "status": "completed",
-            "audio_duration": 120,
-            "utterances": [
-                {
-                    "speaker": "A",
-                    "start": 0,
-                    "end": 5000,
-                    "text": "Hello, this is speaker A talking.",
-                },
-                {
-                    "speaker": "B",
-                    "start": 5000,
-                    "end": 10000,
-                    "text": "Hi, this is speaker B responding.",
-                },
-            ],
-        }
+    def _scan(self, watch_dir: Path, db: Database) -> list[Path]:
+        """Simulate MainMenuScreen's watch-dir scan.
+
+        Known paths are fetched once for membership checks and all
+        inserts from one pass land in a single transaction.
+        """
+        known = db.known_audio_paths()
+        new_files = [
+            Path(path) for path in _iter_audio(watch_dir) if path not in known
+        ]
+        if new_files:
+            db.add_many_audio([str(file) for file in new_files])
+        return new_files
+
+    @pytest.fixture(autouse=True)
+    def _clean_db(self, db):
+        """Reset rows after each test so the shared db stays isolated."""
+        yield
+        db.reset_tables()
 
     def make_transcript(
         self,
@@ -98,11 +158,11 @@ class TestWorkflow:
 
         return TranscriptData(
             source_file=source_file,
-            transcribed=datetime.now(),
+            transcribed=_FIXED_NOW,
             duration_seconds=duration,
             labeled=labeled,
-            speakers=[Speaker.from_dict(s) for s in speakers],
-            utterances=[Utterance.from_dict(u) for u in utterances],
+            speakers=Speaker.from_dicts(speakers),
+            utterances=Utterance.from_dicts(utterances),
         )
 
     # =========================================================================
@@ -115,44 +175,33 @@ class TestWorkflow:
 
         # Create a fake audio file
         audio_file = watch_dir / "test_recording.mp3"
-        audio_file.write_bytes(b"fake audio content")
+        audio_file.touch()
 
         # Simulate the scanning logic from MainMenuScreen._scan_for_new_files
-        audio_extensions = {"mp4", "m4a", "mp3", "wav", "ogg", "webm", "flac"}
-        new_files = []
-
-        for file in watch_dir.iterdir():
-            if file.is_file() and file.suffix.lower().lstrip(".") in audio_extensions:
-                if not db.audio_exists(str(file)):
-                    db.add_audio(str(file))
-                    new_files.append(file)
+        new_files = self._scan(watch_dir, db)
 
         # Verify file was detected
         assert len(new_files) == 1
         assert new_files[0].name == "test_recording.mp3"
 
-        # Verify it's in the database
-        assert db.audio_exists(str(audio_file))
-        audio_id = db.get_audio_id(str(audio_file))
-        assert audio_id is not None
+        # Verify it's in the database; get_audio_id doubles as the
+        # existence check, so one SELECT covers both.
+        assert db.get_audio_id(str(audio_file)) is not None
 
     def test_non_audio_files_ignored(self, temp_dirs, db):
         """Test that non-audio files are ignored."""
         watch_dir = temp_dirs["watch"]
 
         # Create non-audio files
-        (watch_dir / "document.txt").write_text("text content")
-        (watch_dir / "image.png").write_bytes(b"fake image")
-        (watch_dir / "notes.md").write_text("# Notes")
-
-        audio_extensions = {"mp4", "m4a", "mp3", "wav", "ogg", "webm", "flac"}
-        new_files = []
+        _write_all(
+            [
+                (watch_dir / "document.txt", "text content"),
+                (watch_dir / "image.png", b"fake image"),
+                (watch_dir / "notes.md", "# Notes"),
+            ]
+        )
 
-        for file in watch_dir.iterdir():
-            if file.is_file() and file.suffix.lower().lstrip(".") in audio_extensions:
-                if not db.audio_exists(str(file)):
-                    db.add_audio(str(file))
-                    new_files.append(file)
+        new_files = self._scan(watch_dir, db)
 
         assert len(new_files) == 0
         assert db.get_pending_count() == 0
@@ -161,23 +210,15 @@ class TestWorkflow:
         """Test that scanning twice doesn't add duplicates."""
         watch_dir = temp_dirs["watch"]
         audio_file = watch_dir / "test.mp3"
-        audio_file.write_bytes(b"audio")
-
-        audio_extensions = {"mp4", "m4a", "mp3", "wav", "ogg", "webm", "flac"}
+        audio_file.touch()
 
         # First scan
-        for file in watch_dir.iterdir():
-            if file.is_file() and file.suffix.lower().lstrip(".") in audio_extensions:
-                if not db.audio_exists(str(file)):
-                    db.add_audio(str(file))
+        self._scan(watch_dir, db)
 
         assert db.get_pending_count() == 1
 
         # Second scan
-        for file in watch_dir.iterdir():
-            if file.is_file() and file.suffix.lower().lstrip(".") in audio_extensions:
-                if not db.audio_exists(str(file)):
-                    db.add_audio(str(file))
+        self._scan(watch_dir, db)
 
         # Should still be 1
         assert db.get_pending_count() == 1
@@ -186,9 +227,8 @@ class TestWorkflow:
     # Test 2: Transcription
     # =========================================================================
 
-    @patch.object(Transcriber, "transcribe")
     def test_transcription_creates_transcript_file(
-        self, mock_transcribe, temp_dirs, db, mock_assemblyai_response
+        self, monkeypatch, temp_dirs, db, mock_transcript_template
     ):
         """Test that transcription creates a transcript file and updates DB."""
         watch_dir = temp_dirs["watch"]
@@ -196,17 +236,18 @@ class TestWorkflow:
 
         # Create audio file
         audio_file = watch_dir / "2026-01-30-test-recording.mp4"
-        audio_file.write_bytes(b"fake audio")
+        audio_file.touch()
 
         # Add to DB
         audio_id = db.add_audio(str(audio_file))
 
-        # Create mock transcript data
+        # Retarget the prebuilt transcript at this audio file
         transcriber = Transcriber("test-api-key")
-        mock_transcript = transcriber.convert_to_transcript_data(
-            mock_assemblyai_response, str(audio_file)
+        mock_transcript = copy.deepcopy(mock_transcript_template)
+        mock_transcript.source_file = audio_file.name
+        monkeypatch.setattr(
+            Transcriber, "transcribe", lambda *args, **kwargs: mock_transcript
         )
-        mock_transcribe.return_value = mock_transcript
 
         # Use transcribe_and_save
         transcript_path = transcriber.transcribe_and_save(
@@ -274,7 +315,8 @@ class TestWorkflow:
         """Test that multiple unlabeled transcripts are returned in order."""
         raw_dir = temp_dirs["raw_transcripts"]
 
-        # Create multiple transcripts
+        # Create multiple transcripts, then write and register in batches
+        pairs = []
         for i, name in enumerate(["first", "second", "third"]):
             transcript = self.make_transcript(
                 source_file=f"{name}.mp4",
@@ -283,8 +325,10 @@ class TestWorkflow:
                 utterances=[{"speaker": "A", "start": 0.0, "end": 5.0, "text": f"Test {name}"}],
             )
             path = raw_dir / f"2026-01-{10+i:02d}-{name}-transcript.yaml"
-            transcript.save(path)
-            db.add_transcript(str(path))
+            pairs.append((path, transcript.to_yaml()))
+
+        _write_all(pairs)
+        db.add_transcripts([str(path) for path, _ in pairs])
 
         unlabeled = db.get_unlabeled()
         assert len(unlabeled) == 3
@@ -347,9 +391,8 @@ class TestWorkflow:
     # Test 5: Full workflow integration
     # =========================================================================
 
-    @patch.object(Transcriber, "transcribe")
     def test_full_workflow_file_to_labeled(
-        self, mock_transcribe, temp_dirs, db, mock_assemblyai_response
+        self, monkeypatch, temp_dirs, db, mock_transcript_template
     ):
         """Test the complete workflow from new file to labeled transcript."""
         watch_dir = temp_dirs["watch"]
@@ -358,14 +401,10 @@ class TestWorkflow:
 
         # Step 1: New audio file appears
         audio_file = watch_dir / "2026-01-30-meeting.mp4"
-        audio_file.write_bytes(b"fake audio content")
+        audio_file.touch()
 
         # Step 2: File is detected
-        audio_extensions = {"mp4", "m4a", "mp3", "wav", "ogg", "webm", "flac"}
-        for file in watch_dir.iterdir():
-            if file.is_file() and file.suffix.lower().lstrip(".") in audio_extensions:
-                if not db.audio_exists(str(file)):
-                    db.add_audio(str(file))
+        self._scan(watch_dir, db)
 
         audio_id = db.get_audio_id(str(audio_file))
         assert audio_id is not None
@@ -373,10 +412,11 @@ class TestWorkflow:
 
         # Step 3: File is transcribed (mock API)
         transcriber = Transcriber("test-api-key")
-        mock_transcript = transcriber.convert_to_transcript_data(
-            mock_assemblyai_response, str(audio_file)
+        mock_transcript = copy.deepcopy(mock_transcript_template)
+        mock_transcript.source_file = audio_file.name
+        monkeypatch.setattr(
+            Transcriber, "transcribe", lambda *args, **kwargs: mock_transcript
         )
-        mock_transcribe.return_value = mock_transcript
 
         transcript_path = transcriber.transcribe_and_save(str(audio_file), raw_dir)
 
@@ -425,13 +465,13 @@ class TestWorkflow:
         transcript_path = raw_dir / "test-transcript.yaml"
         transcript.save(transcript_path)
 
-        # Read raw content
-        content = transcript_path.read_text()
+        # Parse the two YAML documents once and assert on the data
+        frontmatter, body = yaml.load_all(
+            transcript_path.read_text(), Loader=_YamlLoader
+        )
 
-        # Check key fields are present
-        assert "source_file: test.mp4" in content
-        assert "duration_seconds: 120" in content
-        assert "labeled: false" in content
-        assert "speakers:" in content
-        assert "utterances:" in content
-        assert "Hello there!" in content
+        assert frontmatter["source_file"] == "test.mp4"
+        assert frontmatter["duration_seconds"] == 120
+        assert frontmatter["labeled"] is False
+        assert frontmatter["speakers"]
+        assert any(u["text"] == "Hello there!" for u in body["utterances"])